@@ -5,6 +5,7 @@ import dash
 from dash import dcc, html, Input, Output, State
 import dash_bootstrap_components as dbc 
 import plotly.graph_objects as go
+import plotly.io as pio
 from flask import Flask
 from components.layout import create_layout
 import numpy as np
@@ -16,6 +17,7 @@ from data_processing.experiment_mat_loader import (
     convert_to_dashboard_format,
     add_recording_metrics_to_experiments
 )
+from data_processing.utilities import clear_half_violin_cache
 
 # UTILS PACKAGE IMPORTS - New centralized approach
 from utils import (
@@ -47,6 +49,7 @@ from components.neuronal_activity import (
     create_bar_plot_by_age_recording_level
 )
 from components.network_activity import (
+    clear_figure_cache,
     create_network_half_violin_plot_by_group,
     create_metrics_by_lag_plot,
     create_node_cartography_plot
@@ -56,6 +59,9 @@ from components.network_activity import (
 from callbacks.network_callbacks import register_network_callbacks
 from callbacks.neuronal_callbacks import register_neuronal_callbacks
 
+# Serialize figures with orjson, which encodes the numpy trace arrays natively
+pio.json.config.default_engine = 'orjson'
+
 server = Flask(__name__)
 assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
 os.makedirs(assets_dir, exist_ok=True)
@@ -157,6 +163,10 @@ def load_data_dynamically(n_clicks, data_dir):
     try:
         print(f"🔄 Loading data from ExperimentMatFiles: {data_dir}")
         
+        # Cached KDE results and figures belong to the previously loaded data
+        clear_half_violin_cache()
+        clear_figure_cache()
+        
         # Step 1: Scan ExperimentMatFiles folder
         print("📁 Scanning ExperimentMatFiles folder...")
         data_info = scan_experiment_mat_folder(data_dir)
@@ -194,7 +204,9 @@ def load_data_dynamically(n_clicks, data_dir):
             'neuronal': neuronal_data,
             'network': network_data,
             'cartography': cartography_data,
-            'loaded': True
+            'loaded': True,
+            # Identifies this load; cached network figures are keyed on it
+            'data_token': (os.path.abspath(data_dir), datetime.now().isoformat())
         }
         
         # Step 5: Debug output
@@ -2,6 +2,7 @@ from dash.dependencies import Input, Output
 import plotly.graph_objects as go
 from data_processing.utilities import extract_div_value, safe_flatten_array
 from components.network_activity import (
+    get_cached_figure,
     create_network_half_violin_plot_by_group,
     create_metrics_by_lag_plot,
     create_node_cartography_plot
@@ -27,50 +28,54 @@ def register_network_callbacks(app):
         if not metric or not lag:
             return go.Figure()
         
-        # Get data
-        data = app.data['network']
-        
-        # Create the data structure for plotting
-        recording_data = {
-            'by_group': {},
-            'by_experiment': {},
-            'groups': data['groups'],
-            'divs': data['divs']
-        }
-        
-        # Initialize group data
-        for group in data['groups']:
-            recording_data['by_group'][group] = {
-                metric: [],
-                'exp_names': []
+        def build():
+            # Get data
+            data = app.data['network']
+            
+            # Create the data structure for plotting
+            recording_data = {
+                'by_group': {},
+                'by_experiment': {},
+                'groups': data['groups'],
+                'divs': data['divs']
             }
-        
-        # Copy data from the loaded structure
-        for group in data['groups']:
-            if group in data['by_group'] and lag in data['by_group'][group]:
-                if 'node_metrics' in data['by_group'][group][lag] and metric in data['by_group'][group][lag]['node_metrics']:
-                    # Copy metric values
-                    values = data['by_group'][group][lag]['node_metrics'][metric]
-                    recording_data['by_group'][group][metric] = values
-                    
-                    # Copy experiment names
-                    recording_data['by_group'][group]['exp_names'] = data['by_group'][group][lag]['node_metrics']['exp_names']
-        
-        # If no group data is available, try to get data from individual experiments
-        if all(len(recording_data['by_group'][group][metric]) == 0 for group in data['groups']):
-            # Try to rebuild from experiments
-            for exp_name, exp_data in data['by_experiment'].items():
-                if 'group' in exp_data and 'lags' in exp_data and lag in exp_data['lags']:
-                    group = exp_data['group']
-                    if 'node_metrics' in exp_data['lags'][lag] and metric in exp_data['lags'][lag]['node_metrics']:
-                        values = exp_data['lags'][lag]['node_metrics'][metric]
-                        if values:
-                            recording_data['by_group'][group][metric].extend(safe_flatten_array(values))
-                            recording_data['by_group'][group]['exp_names'].append(exp_name)
-        
-        # Create figure
-        title = f"Node-Level {metric} by Group (Lag {lag} ms)"
-        return create_network_half_violin_plot_by_group(recording_data, metric, lag, title, level='node')
+            
+            # Initialize group data
+            for group in data['groups']:
+                recording_data['by_group'][group] = {
+                    metric: [],
+                    'exp_names': []
+                }
+            
+            # Copy data from the loaded structure
+            for group in data['groups']:
+                if group in data['by_group'] and lag in data['by_group'][group]:
+                    if 'node_metrics' in data['by_group'][group][lag] and metric in data['by_group'][group][lag]['node_metrics']:
+                        # Copy metric values
+                        values = data['by_group'][group][lag]['node_metrics'][metric]
+                        recording_data['by_group'][group][metric] = values
+                        
+                        # Copy experiment names
+                        recording_data['by_group'][group]['exp_names'] = data['by_group'][group][lag]['node_metrics']['exp_names']
+            
+            # If no group data is available, try to get data from individual experiments
+            if all(len(recording_data['by_group'][group][metric]) == 0 for group in data['groups']):
+                # Try to rebuild from experiments
+                for exp_name, exp_data in data['by_experiment'].items():
+                    if 'group' in exp_data and 'lags' in exp_data and lag in exp_data['lags']:
+                        group = exp_data['group']
+                        if 'node_metrics' in exp_data['lags'][lag] and metric in exp_data['lags'][lag]['node_metrics']:
+                            values = exp_data['lags'][lag]['node_metrics'][metric]
+                            if values:
+                                recording_data['by_group'][group][metric].extend(safe_flatten_array(values))
+                                recording_data['by_group'][group]['exp_names'].append(exp_name)
+            
+            # Create figure
+            title = f"Node-Level {metric} by Group (Lag {lag} ms)"
+            return create_network_half_violin_plot_by_group(recording_data, metric, lag, title, level='node')
+        
+        # The figure only depends on the loaded data and the plot arguments
+        return get_cached_figure(app.data.get('data_token'), ('node_group', metric, lag), build)
     
     # Callback for node-level network metrics by age - PLACEHOLDER
     @app.callback(
@@ -119,7 +124,10 @@ def register_network_callbacks(app):
         
         # Create figure
         title = f"Network-Level {metric} by Group"
-        return create_network_half_violin_plot_by_group(data, metric, lag, title, level='network')
+        return get_cached_figure(
+            app.data.get('data_token'), ('network_group', metric, lag),
+            lambda: create_network_half_violin_plot_by_group(data, metric, lag, title, level='network')
+        )
     
     # Callback for network-level metrics by age - PLACEHOLDER
     @app.callback(
@@ -167,7 +175,10 @@ def register_network_callbacks(app):
         data = app.data['network']
         
         # Create figure
-        return create_metrics_by_lag_plot(data, group, metric)
+        return get_cached_figure(
+            app.data.get('data_token'), ('lag', group, metric),
+            lambda: create_metrics_by_lag_plot(data, group, metric)
+        )
     
     # Callback for node cartography proportions plot
     @app.callback(
@@ -183,7 +194,10 @@ def register_network_callbacks(app):
         data = app.data['cartography']
         
         # Create figure
-        return create_node_cartography_plot(data, group, lag)
+        return get_cached_figure(
+            app.data.get('data_token'), ('cartography', group, lag),
+            lambda: create_node_cartography_plot(data, group, lag)
+        )
     
     # Callback for node cartography scatter plot
     @app.callback(
@@ -31,6 +31,9 @@ from components.neuronal_activity import (
     create_bar_plot_by_age_recording_level
 )
 
+# Burst metrics that get the distribution diagnostic before plotting
+BURST_DIAGNOSTIC_METRICS = frozenset(['channelBurstRate', 'channelFRinBurst', 'channelBurstDur'])
+
 def register_neuronal_callbacks(app):
     """
     Register REFACTORED neuronal activity callbacks with Y-AXIS support
@@ -247,7 +250,7 @@ def register_neuronal_callbacks(app):
             processed_data = process_metric(metric, app.data['neuronal'], groups, selected_divs)
 
             # ADD DIAGNOSTIC FOR BURST METRICS
-            if metric in ['channelBurstRate', 'channelFRinBurst', 'channelBurstDur']:
+            if metric in BURST_DIAGNOSTIC_METRICS:
                 analyze_burst_data_distribution(app.data['neuronal'], metric)
 
             # Create title using utils
@@ -290,7 +293,7 @@ def register_neuronal_callbacks(app):
             processed_data = process_metric(metric, app.data['neuronal'], groups, selected_divs)
 
             # ADD DIAGNOSTIC FOR BURST METRICS
-            if metric in ['channelBurstRate', 'channelFRinBurst', 'channelBurstDur']:
+            if metric in BURST_DIAGNOSTIC_METRICS:
                 analyze_burst_data_distribution(app.data['neuronal'], metric)
 
             # Create title using utils
@@ -332,7 +335,7 @@ def register_neuronal_callbacks(app):
             # Process the data using utils package
             processed_data = process_metric(metric, app.data['neuronal'], groups, selected_divs)
 
-            if metric in ['channelBurstRate', 'channelFRinBurst', 'channelBurstDur']:
+            if metric in BURST_DIAGNOSTIC_METRICS:
                 from components.neuronal_activity import analyze_burst_data_distribution
                 analyze_burst_data_distribution(app.data['neuronal'], metric)
 
@@ -376,7 +379,7 @@ def register_neuronal_callbacks(app):
             processed_data = process_metric(metric, app.data['neuronal'], groups, selected_divs)
 
             # ADD DIAGNOSTIC FOR BURST METRICS
-            if metric in ['channelBurstRate', 'channelFRinBurst', 'channelBurstDur']:
+            if metric in BURST_DIAGNOSTIC_METRICS:
                 analyze_burst_data_distribution(app.data['neuronal'], metric)
 
             # Create title using utils
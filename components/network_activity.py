@@ -1,8 +1,18 @@
 # components/network_activity.py - Enhanced Network Visualizations - VERIFIED
+import functools
+import logging
+import threading
+from collections import OrderedDict, defaultdict
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from data_processing.utilities import calculate_half_violin_data
+from utils.config import hex_to_rgba
+from data_processing.utilities import (
+    calculate_half_violin_data, index_experiments_by_div,
+    CARTOGRAPHY_ROLES, encode_cartography_roles, count_cartography_roles
+)
+
+logger = logging.getLogger(__name__)
 
 # Modern, accessible color palette (matching neuronal_activity.py)
 MODERN_COLORS = {
@@ -23,6 +33,117 @@ MODERN_COLORS = {
     'text': '#2C3E50'
 }
 
+# Enhanced node cartography role colors
+ROLE_COLORS = {
+    'Peripheral': '#FF6B6B',
+    'Non-hub connector': '#4ECDC4',
+    'Non-hub kinless': '#45B7D1',
+    'Provincial hub': '#96CEB4',
+    'Connector hub': '#FFEAA7',
+    'Kinless hub': '#DDA0DD'
+}
+
+# Marker color per DIV; other DIVs use the DIV 53 color
+DIV_COLORS = {50: MODERN_COLORS['age_50'], 53: MODERN_COLORS['age_53']}
+
+# Translucent box and violin fills for the DIV colors, keyed by color
+_FILL_RGBA_30 = {color: hex_to_rgba(color, 0.3) for color in DIV_COLORS.values()}
+_FILL_RGBA_40 = {color: hex_to_rgba(color, 0.4) for color in DIV_COLORS.values()}
+
+# Canonical role order (ROLE_COLORS lists the roles in this order)
+ROLE_ORDER = CARTOGRAPHY_ROLES
+
+# Above this many points per subplot, jittered markers are merged on a grid
+MAX_SUBPLOT_SCATTER_POINTS = 5000
+SCATTER_AGGREGATION_BINS = 100
+
+# Jittered marker traces with more points than this use Scattergl
+WEBGL_POINT_THRESHOLD = 1000
+
+# Number of distinct experiment name lists whose DIV index is kept
+DIV_INDEX_CACHE_SIZE = 128
+
+# LRU cache of built figures for get_cached_figure, keyed by the loaded dataset's
+# token and the plot arguments
+FIGURE_CACHE_SIZE = 128
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+# Metrics stored under 'network_metrics' (everything else is node level)
+NETWORK_LEVEL_METRICS = frozenset([
+    'aN', 'Dens', 'NDmean', 'NDtop25', 'sigEdgesMean', 'sigEdgesTop10',
+    'NSmean', 'ElocMean', 'CC', 'nMod', 'Q', 'PL', 'PCmean', 'Eglob', 'SW', 'SWw'
+])
+
+# Network metric labels with units
+NETWORK_METRIC_LABELS = {
+    # Node-level metrics
+    'ND': 'Node Degree',
+    'NS': 'Node Strength', 
+    'MEW': 'Mean Edge Weight',
+    'Eloc': 'Local Efficiency',
+    'BC': 'Betweenness Centrality',
+    'PC': 'Participation Coefficient',
+    'Z': 'Within-Module Z-score',
+    'aveControl': 'Average Controllability',
+    'modalControl': 'Modal Controllability',
+    
+    # Network-level metrics
+    'aN': 'Active Nodes',
+    'Dens': 'Network Density',
+    'NDmean': 'Mean Node Degree',
+    'NDtop25': 'Top 25% Node Degree',
+    'sigEdgesMean': 'Mean Significant Edge Weight',
+    'sigEdgesTop10': 'Top 10% Edge Weight',
+    'NSmean': 'Mean Node Strength',
+    'ElocMean': 'Mean Local Efficiency',
+    'CC': 'Clustering Coefficient',
+    'nMod': 'Number of Modules',
+    'Q': 'Modularity',
+    'PL': 'Path Length',
+    'PCmean': 'Mean Participation Coefficient',
+    'Eglob': 'Global Efficiency',
+    'SW': 'Small-worldness Sigma',
+    'SWw': 'Small-worldness Omega'
+}
+
+def get_cached_figure(data_token, cache_key, build):
+    """
+    Return a copy of the figure build() makes, memoized under data_token and cache_key
+    
+    Callers that own the loaded data pass its load token and the plot arguments as
+    cache_key; build takes no arguments. With data_token None nothing is cached.
+    """
+    if data_token is None:
+        return build()
+    
+    full_key = (data_token, cache_key)
+    try:
+        hash(full_key)
+    except TypeError:
+        return build()
+    
+    with _figure_cache_lock:
+        cached_fig = _figure_cache.get(full_key)
+        if cached_fig is not None:
+            _figure_cache.move_to_end(full_key)
+    if cached_fig is not None:
+        return go.Figure(cached_fig)
+    
+    fig = build()
+    
+    with _figure_cache_lock:
+        _figure_cache[full_key] = fig
+        _figure_cache.move_to_end(full_key)
+        if len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+    return go.Figure(fig)
+
+def clear_figure_cache():
+    """Drop all cached network figures (call when new data is loaded)"""
+    with _figure_cache_lock:
+        _figure_cache.clear()
+
 def determine_plot_style(data_count):
     """Determine the best plot style based on data density"""
     if data_count == 0:
@@ -36,174 +157,273 @@ def determine_plot_style(data_count):
     else:
         return 'violin_plot'
 
-def create_enhanced_network_half_violin_plot_by_group(data, metric, lag, title, level='node'):
+def _aggregate_scatter_points(x, y, bins=SCATTER_AGGREGATION_BINS):
     """
-    Create an enhanced half violin plot for network metrics by group with adaptive visualization
+    Merge nearby points onto a bins x bins grid
+    
+    Returns the centers of the occupied cells and the number of points in each.
+    """
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    x_idx, y_idx = np.nonzero(counts)
+    x_centers = (x_edges[x_idx] + x_edges[x_idx + 1]) / 2
+    y_centers = (y_edges[y_idx] + y_edges[y_idx + 1]) / 2
+    return x_centers, y_centers, counts[x_idx, y_idx]
+
+def _fill_jitter(rng, out, x_base, scale):
+    """Fill out in place with normal jitter of the given scale around x_base"""
+    rng.standard_normal(dtype=np.float32, out=out)
+    out *= scale
+    out += x_base
+    return out
+
+@functools.lru_cache(maxsize=DIV_INDEX_CACHE_SIZE)
+def _div_index_for_names(exp_names):
+    """Map each DIV to the positions of its experiments in the exp_names tuple"""
+    div_positions = index_experiments_by_div(exp_names)
+    return {div: np.asarray(positions, dtype=np.intp) for div, positions in div_positions.items()}
+
+def _get_div_index(metrics_data):
     """
-    # print(f"\nDEBUG: Creating enhanced network half violin plot by group for metric: {metric}, lag: {lag}")
+    Map each DIV to the positions of its experiments in metrics_data['exp_names']
     
-    groups = data['groups']
-    divs = sorted(data['divs'])
+    The map is cached by the exact sequence of names, so the metrics of one
+    group/lag share a single pass over them and a changed list is re-indexed.
+    """
+    return _div_index_for_names(tuple(metrics_data.get('exp_names', [])))
+
+def _get_role_fractions(cart_data):
+    """
+    Fraction of nodes in each ROLE_ORDER role for one experiment/lag, or None without roles
     
-    # Create figure with enhanced styling
-    fig = make_subplots(
-        rows=1, cols=len(groups), 
-        subplot_titles=[f'<b>{g}</b>' for g in groups],
-        shared_yaxes=True,
-        horizontal_spacing=0.08
-    )
+    Uses the fractions computed at load time when present, otherwise counts the
+    role codes (or labels) of cart_data.
+    """
+    if 'role_fractions' in cart_data:
+        return cart_data['role_fractions']
+    
+    role_codes = cart_data.get('role_codes')
+    if role_codes is None:
+        role_codes = encode_cartography_roles(cart_data['roles'])
+    if role_codes.size == 0:
+        return None
+    
+    # Unrecognised labels count toward the total but toward no role
+    return count_cartography_roles(role_codes) / role_codes.size
+
+def _index_experiments_by_group_div(data):
+    """
+    Group data['by_experiment'] entries by their (group, DIV) pair
+    
+    Uses the index built at load time when present.
+    """
+    if 'exps_by_group_div' in data:
+        return data['exps_by_group_div']
+    
+    exps_by_group_div = defaultdict(list)
+    for exp_data in data['by_experiment'].values():
+        exps_by_group_div[(exp_data.get('group'), exp_data.get('div'))].append(exp_data)
+    return exps_by_group_div
+
+def _build_network_group_traces(group, group_data, metric, divs, div_colors):
+    """
+    Build the traces of one group's subplot for the network half violin plot
     
+    Returns (traces, min_y, max_y) where traces is a list of (trace, legend_label)
+    pairs; legend_label names the DIV legend entry a trace may carry, or is None.
+    """
+    traces = []
+    summary_segments = []
     max_y = 0
     min_y = float('inf')
-    legend_added = {'DIV 50': False, 'DIV 53': False}
     
-    for col, group in enumerate(groups, 1):
-        if group not in data['by_group']:
-            print(f"Group {group} not found in data")
-            continue
-            
-        if lag not in data['by_group'][group]:
-            print(f"Lag {lag} not found in group {group}")
-            continue
-        
-        level_key = 'node_metrics' if level == 'node' else 'network_metrics'
-        group_data = data['by_group'][group][lag][level_key]
+    # Process metric values into one float ndarray (None -> NaN so one isfinite pass drops both)
+    values = group_data[metric]
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        values = values.astype(float, copy=False).ravel()
+    elif isinstance(values, (list, np.ndarray)):
+        # Lists and object arrays (e.g. MATLAB cells) may hold None
+        values = np.ravel(values) if isinstance(values, np.ndarray) else values
+        values = np.fromiter((np.nan if v is None else v for v in values), dtype=float, count=len(values))
+    else:
+        values = np.atleast_1d(np.asarray(np.nan if values is None else values, dtype=float))
+    if values.size == 0:
+        logger.debug("No values for group %s", group)
+        return traces, min_y, max_y
+
+    # Filter out invalid values (clean data is used as is, without a masked copy)
+    finite_mask = np.isfinite(values)
+    filtered_values = values if finite_mask.all() else values[finite_mask]
+    if filtered_values.size == 0:
+        logger.debug("No valid values for group %s", group)
+        return traces, min_y, max_y
+    
+    # Very dense subplots get their jittered markers merged to keep rendering fast
+    aggregate_points = filtered_values.size > MAX_SUBPLOT_SCATTER_POINTS
+    
+    # Positions of each DIV's experiments, for DIV filtering
+    div_index = _get_div_index(group_data) if group_data.get('exp_names') else None
+    no_positions = np.empty(0, dtype=np.intp)
+    
+    # One jitter buffer for the whole subplot; each DIV fills its own slice of it
+    rng = np.random.default_rng(0)
+    jitter_buf = np.empty(values.size if div_index is not None else filtered_values.size * len(divs), dtype=np.float32)
+    jitter_offset = 0
+    
+    for div_idx, div in enumerate(divs):
+        if div_index is not None:
+            # Gather this DIV's values by position, then drop the invalid ones
+            positions = div_index.get(div, no_positions)
+            div_values = values[positions[positions < values.size]]
+            div_values = div_values[np.isfinite(div_values)]
+        else:
+            # No experiment names - use all values (fallback)
+            div_values = filtered_values
         
-        if metric not in group_data:
-            print(f"Metric {metric} not found in group {group} at lag {lag}")
+        if len(div_values) == 0:
             continue
         
-        # Process metric values
-        values = group_data[metric]
-        if isinstance(values, np.ndarray):
-            values = values.tolist()
-        elif not isinstance(values, list):
-            values = [values]
+        # Update y-axis range
+        max_y = max(max_y, float(div_values.max()))
+        min_y = min(min_y, float(div_values.min()))
         
-        # Filter out invalid values
-        filtered_values = [v for v in values if v is not None and np.isfinite(v)]
-        if not filtered_values:
-            print(f"No valid values for group {group}")
-            continue
-        
-        # Get experiment names for DIV filtering
-        exp_names = group_data.get('exp_names', [])
+        # Determine visualization style
+        plot_style = determine_plot_style(len(div_values))
+        div_y = np.asarray(div_values, dtype=np.float32)
+        color = div_colors[div]
+        div_label = f'DIV {div}'
+        x_base = div_idx + 1
         
-        for div_idx, div in enumerate(divs):
-            div_values = []
-            
-            if exp_names:
-                # Filter values by DIV using experiment names
-                for i, exp_name in enumerate(exp_names):
-                    if i < len(filtered_values) and any(f'DIV{div}' in part for part in exp_name.split('_')):
-                        div_values.append(filtered_values[i])
-            else:
-                # No experiment names - use all values (fallback)
-                div_values = filtered_values
+        if plot_style == 'single_point':
+            # Single point with emphasis
+            traces.append((
+                go.Scatter(
+                    x=np.array([x_base], dtype=np.float32),
+                    y=div_y,
+                    mode='markers',
+                    marker=dict(
+                        color=color,
+                        size=14,
+                        line=dict(width=2, color='white'),
+                        opacity=0.9
+                    ),
+                    name=div_label,
+                    legendgroup=div_label,
+                    showlegend=False,
+                    hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
+                ),
+                div_label
+            ))
             
-            if len(div_values) == 0:
-                continue
+        elif plot_style == 'scatter_only':
+            # Enhanced scatter for few points
+            jitter_x = _fill_jitter(rng, jitter_buf[jitter_offset:jitter_offset + len(div_values)], x_base, 0.08)
+            jitter_offset += len(div_values)
+            traces.append((
+                go.Scatter(
+                    x=jitter_x,
+                    y=div_y,
+                    mode='markers',
+                    marker=dict(
+                        color=color,
+                        size=10,
+                        line=dict(width=1, color='white'),
+                        opacity=0.8
+                    ),
+                    name=div_label,
+                    legendgroup=div_label,
+                    showlegend=False,
+                    hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
+                ),
+                div_label
+            ))
             
-            # Update y-axis range
-            max_y = max(max_y, max(div_values))
-            min_y = min(min_y, min(div_values))
+            # Add mean line
+            mean_val = np.mean(div_values)
+            traces.append((
+                go.Scatter(
+                    x=np.array([x_base - 0.15, x_base + 0.15], dtype=np.float32),
+                    y=np.array([mean_val, mean_val], dtype=np.float32),
+                    mode='lines',
+                    line=dict(color=color, width=3),
+                    showlegend=False,
+                    hovertemplate=f'Mean: {mean_val:.4f}<extra></extra>'
+                ),
+                None
+            ))
             
-            # Determine visualization style
-            plot_style = determine_plot_style(len(div_values))
-            color = MODERN_COLORS['age_50'] if div == 50 else MODERN_COLORS['age_53']
-            div_label = f'DIV {div}'
-            x_base = div_idx + 1
+        elif plot_style == 'box_plot':
+            # Enhanced box plot for medium data
+            traces.append((
+                go.Box(
+                    x0=x_base,
+                    y=div_y,
+                    width=0.4,
+                    name=div_label,
+                    legendgroup=div_label,
+                    showlegend=False,
+                    marker_color=color,
+                    line_color=color,
+                    fillcolor=_FILL_RGBA_30[color],
+                    boxpoints=False
+                ),
+                div_label
+            ))
             
-            if plot_style == 'single_point':
-                # Single point with emphasis
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base],
-                        y=div_values,
-                        mode='markers',
-                        marker=dict(
-                            color=color,
-                            size=14,
-                            line=dict(width=2, color='white'),
-                            opacity=0.9
-                        ),
-                        name=div_label,
-                        legendgroup=div_label,
-                        showlegend=not legend_added[div_label],
-                        hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
+            # Points are jittered here rather than by plotly.js on every redraw
+            jitter_x = _fill_jitter(rng, jitter_buf[jitter_offset:jitter_offset + len(div_values)], x_base, 0.08)
+            jitter_offset += len(div_values)
+            traces.append((
+                go.Scatter(
+                    x=jitter_x,
+                    y=div_y,
+                    mode='markers',
+                    marker=dict(
+                        color=color,
+                        size=5,
+                        opacity=0.6
                     ),
-                    row=1, col=col
-                )
-                legend_added[div_label] = True
-                
-            elif plot_style == 'scatter_only':
-                # Enhanced scatter for few points
-                jitter = np.random.normal(0, 0.08, size=len(div_values))
-                fig.add_trace(
+                    showlegend=False,
+                    hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
+                ),
+                None
+            ))
+            
+        else:  # violin_plot
+            # Enhanced violin plot for rich data
+            kde_data = calculate_half_violin_data(div_values)
+            
+            # Add individual points with smart jitter
+            jitter_x = _fill_jitter(rng, jitter_buf[jitter_offset:jitter_offset + len(div_values)], x_base, 0.05)
+            jitter_offset += len(div_values)
+            if aggregate_points:
+                # Merged markers, sized by how many points each one stands for
+                x_centers, y_centers, counts = _aggregate_scatter_points(jitter_x, div_y)
+                traces.append((
                     go.Scatter(
-                        x=[x_base + j for j in jitter],
-                        y=div_values,
+                        x=x_centers.astype(np.float32),
+                        y=y_centers.astype(np.float32),
                         mode='markers',
                         marker=dict(
                             color=color,
-                            size=10,
-                            line=dict(width=1, color='white'),
-                            opacity=0.8
+                            size=np.clip(6 * np.sqrt(counts), 6, 30),
+                            opacity=0.7,
+                            line=dict(width=0.5, color='white')
                         ),
+                        customdata=counts.astype(np.int32),
                         name=div_label,
                         legendgroup=div_label,
-                        showlegend=not legend_added[div_label],
-                        hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                legend_added[div_label] = True
-                
-                # Add mean line
-                mean_val = np.mean(div_values)
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base - 0.15, x_base + 0.15],
-                        y=[mean_val, mean_val],
-                        mode='lines',
-                        line=dict(color=color, width=3),
                         showlegend=False,
-                        hovertemplate=f'Mean: {mean_val:.4f}<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                
-            elif plot_style == 'box_plot':
-                # Enhanced box plot for medium data
-                fig.add_trace(
-                    go.Box(
-                        x=[div_label] * len(div_values),
-                        y=div_values,
-                        name=div_label,
-                        legendgroup=div_label,
-                        showlegend=not legend_added[div_label],
-                        marker_color=color,
-                        line_color=color,
-                        fillcolor=color.replace(')', ', 0.3)').replace('rgb', 'rgba') if 'rgb' in color else color + '4D',
-                        boxpoints='all',
-                        jitter=0.3,
-                        pointpos=-1.8 if div == 50 else 1.8,
-                        hoverton='all'
+                        hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<br>Points: %{{customdata}}<extra></extra>'
                     ),
-                    row=1, col=col
-                )
-                legend_added[div_label] = True
-                
-            else:  # violin_plot
-                # Enhanced violin plot for rich data
-                kde_data = calculate_half_violin_data(div_values)
-                
-                # Add individual points with smart jitter
-                jitter = np.random.normal(0, 0.05, size=len(div_values))
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base + j for j in jitter],
-                        y=div_values,
+                    div_label
+                ))
+            else:
+                # Large point clouds render through WebGL
+                scatter_cls = go.Scattergl if len(div_values) > WEBGL_POINT_THRESHOLD else go.Scatter
+                traces.append((
+                    scatter_cls(
+                        x=jitter_x,
+                        y=div_y,
                         mode='markers',
                         marker=dict(
                             color=color,
@@ -213,59 +433,143 @@ def create_enhanced_network_half_violin_plot_by_group(data, metric, lag, title,
                         ),
                         name=div_label,
                         legendgroup=div_label,
-                        showlegend=not legend_added[div_label],
-                        hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                legend_added[div_label] = True
-                
-                # Add enhanced violin
-                fig.add_trace(
-                    go.Violin(
-                        x=[x_base] * len(kde_data['x']),
-                        y=kde_data['x'],
-                        width=0.6,
-                        side='positive',
-                        line_color=color,
-                        fillcolor=color.replace(')', ', 0.4)').replace('rgb', 'rgba') if 'rgb' in color else color + '66',
-                        points=False,
-                        meanline_visible=False,
-                        showlegend=False,
-                        hoverinfo='skip'
-                    ),
-                    row=1, col=col
-                )
-                
-                # Enhanced mean and confidence interval
-                mean_val = kde_data['mean']
-                sem_val = kde_data['sem']
-                
-                # Mean line
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base - 0.2, x_base + 0.3],
-                        y=[mean_val, mean_val],
-                        mode='lines',
-                        line=dict(color='#2C3E50', width=3),
-                        showlegend=False,
-                        hovertemplate=f'Mean: {mean_val:.4f}<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                
-                # Confidence interval
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base, x_base],
-                        y=[mean_val - sem_val, mean_val + sem_val],
-                        mode='lines',
-                        line=dict(color='#2C3E50', width=2),
                         showlegend=False,
-                        hovertemplate=f'95% CI<extra></extra>'
+                        hovertemplate=f'{div_label}<br>Value: %{{y:.4f}}<extra></extra>'
                     ),
-                    row=1, col=col
-                )
+                    div_label
+                ))
+            
+            # Add enhanced violin
+            traces.append((
+                go.Violin(
+                    x0=x_base,
+                    y=np.asarray(kde_data['x'], dtype=np.float32),
+                    width=0.6,
+                    side='positive',
+                    line_color=color,
+                    fillcolor=_FILL_RGBA_40[color],
+                    points=False,
+                    meanline_visible=False,
+                    showlegend=False,
+                    hoverinfo='skip'
+                ),
+                None
+            ))
+            
+            # Enhanced mean and confidence interval, drawn once per group below
+            summary_segments.append((x_base, kde_data['mean'], kde_data['sem']))
+    
+    if summary_segments:
+        # One trace each for the mean lines and the SEM bars of every violin,
+        # with NaN gaps separating the DIVs
+        seg_x, seg_mean, seg_sem = (np.array(col, dtype=np.float32) for col in zip(*summary_segments))
+        gap = np.full_like(seg_x, np.nan)
+        
+        # Mean lines
+        traces.append((
+            go.Scatter(
+                x=np.column_stack([seg_x - 0.2, seg_x + 0.3, gap]).ravel(),
+                y=np.column_stack([seg_mean, seg_mean, gap]).ravel(),
+                customdata=np.repeat(seg_mean, 3),
+                mode='lines',
+                line=dict(color='#2C3E50', width=3),
+                showlegend=False,
+                hovertemplate='Mean: %{customdata:.4f}<extra></extra>'
+            ),
+            None
+        ))
+        
+        # Confidence intervals
+        traces.append((
+            go.Scatter(
+                x=np.column_stack([seg_x, seg_x, gap]).ravel(),
+                y=np.column_stack([seg_mean - seg_sem, seg_mean + seg_sem, gap]).ravel(),
+                mode='lines',
+                line=dict(color='#2C3E50', width=2),
+                showlegend=False,
+                hovertemplate='95% CI<extra></extra>'
+            ),
+            None
+        ))
+    
+    return traces, min_y, max_y
+
+def create_enhanced_network_half_violin_plot_by_group(data, metric, lag, title, level='node'):
+    """
+    Create an enhanced half violin plot for network metrics by group with adaptive visualization
+    """
+    logger.debug("Creating enhanced network half violin plot by group for metric: %s, lag: %s", metric, lag)
+    
+    groups = data['groups']
+    divs = sorted(data['divs'])
+    
+    max_y = 0
+    min_y = float('inf')
+    level_key = 'node_metrics' if level == 'node' else 'network_metrics'
+    
+    # Resolve each group's data up front; the lookups are cheap
+    by_group = data['by_group']
+    group_jobs = []
+    for group in groups:
+        group_lags = by_group.get(group)
+        if group_lags is None:
+            logger.debug("Group %s not found in data", group)
+            continue
+        
+        lag_data = group_lags.get(lag)
+        if lag_data is None:
+            logger.debug("Lag %s not found in group %s", lag, group)
+            continue
+        
+        group_data = lag_data.get(level_key)
+        if group_data is None:
+            logger.debug("No %s for group %s at lag %s", level_key, group, lag)
+            continue
+        
+        if metric not in group_data:
+            logger.debug("Metric %s not found in group %s at lag %s", metric, group, lag)
+            continue
+        
+        group_jobs.append((group, group_data))
+    
+    # DIV colors are fixed for the whole figure
+    div_colors = {div: DIV_COLORS.get(div, DIV_COLORS[53]) for div in divs}
+    
+    # Each group's traces (KDE included) are built in group order
+    group_results = [
+        _build_network_group_traces(group, group_data, metric, divs, div_colors)
+        for group, group_data in group_jobs
+    ]
+    
+    # Only groups that produced traces get a subplot; with none, keep the empty grid
+    plotted = [(group, result) for (group, _), result in zip(group_jobs, group_results) if result[0]]
+    plotted_groups = [group for group, _ in plotted] or groups
+    
+    # Create figure with enhanced styling
+    fig = make_subplots(
+        rows=1, cols=len(plotted_groups), 
+        subplot_titles=[f'<b>{g}</b>' for g in plotted_groups],
+        shared_yaxes=True,
+        horizontal_spacing=0.08
+    )
+    
+    # Stitch in group order so the first subplot with a DIV owns its legend entry
+    traces = []
+    trace_cols = []
+    legend_added = set()
+    for col, (_, (group_traces, group_min, group_max)) in enumerate(plotted, 1):
+        min_y = min(min_y, group_min)
+        max_y = max(max_y, group_max)
+        
+        for trace, legend_label in group_traces:
+            if legend_label is not None:
+                trace.showlegend = legend_label not in legend_added
+                legend_added.add(legend_label)
+            traces.append(trace)
+            trace_cols.append(col)
+    
+    if traces:
+        fig.add_traces(traces, rows=[1] * len(traces), cols=trace_cols)
     
     # Enhanced layout with modern styling
     fig.update_layout(
@@ -278,6 +582,7 @@ def create_enhanced_network_half_violin_plot_by_group(data, metric, lag, title,
         plot_bgcolor='white',
         paper_bgcolor=MODERN_COLORS['background'],
         margin=dict(l=60, r=60, t=100, b=80),
+        hovermode='closest', hoverdistance=20, spikedistance=20,  # bounded hover search over dense points
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -295,17 +600,15 @@ def create_enhanced_network_half_violin_plot_by_group(data, metric, lag, title,
         )
     )
     
-    # Update x-axes with better styling
-    for col in range(1, len(groups) + 1):
-        fig.update_xaxes(
-            tickvals=list(range(1, len(divs) + 1)),
-            ticktext=[f'<b>DIV {div}</b>' for div in divs],
-            showgrid=False,
-            showline=True,
-            linewidth=1,
-            linecolor='rgba(0,0,0,0.1)',
-            row=1, col=col
-        )
+    # Update x-axes with better styling (one call styles every subplot)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(divs) + 1)),
+        ticktext=[f'<b>DIV {div}</b>' for div in divs],
+        showgrid=False,
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(0,0,0,0.1)'
+    )
     
     # Update y-axis with better styling
     y_range = max_y - min_y if min_y != float('inf') else max_y
@@ -336,7 +639,8 @@ def create_enhanced_metrics_by_lag_plot(data, group, metric):
     fig = go.Figure()
     
     # Get data for the group
-    if group not in data['by_group']:
+    group_data = data['by_group'].get(group)
+    if group_data is None:
         fig.update_layout(
             title=f"<b>No data available for group {group}</b>",
             height=600,
@@ -346,16 +650,22 @@ def create_enhanced_metrics_by_lag_plot(data, group, metric):
         )
         return fig
     
-    group_data = data['by_group'][group]
     divs = sorted(data['divs'])
     lags = sorted(data['lags'])
     
     # Determine if this is a node or network metric
-    is_network_metric = metric in ['aN', 'Dens', 'NDmean', 'NDtop25', 'sigEdgesMean', 'sigEdgesTop10', 
-                                  'NSmean', 'ElocMean', 'CC', 'nMod', 'Q', 'PL', 'PCmean', 'Eglob', 'SW', 'SWw']
-    level_key = 'network_metrics' if is_network_metric else 'node_metrics'
+    level_key = 'network_metrics' if metric in NETWORK_LEVEL_METRICS else 'node_metrics'
+    
+    # Look up each lag's DIV positions once instead of once per DIV
+    lag_records = []
+    for lag in lags:
+        lag_data = group_data.get(lag, {}).get(level_key)
+        if lag_data is not None and metric in lag_data and 'exp_names' in lag_data:
+            metric_arr = np.asarray(lag_data[metric], dtype=float).ravel()
+            lag_records.append((lag, _get_div_index(lag_data), metric_arr))
     
-    # For each DIV, plot metric across lags
+    # For each DIV, plot metric across lags (traces are added to the figure together)
+    traces = []
     for div_idx, div in enumerate(divs):
         color = MODERN_COLORS['groups'][div_idx % len(MODERN_COLORS['groups'])]
         
@@ -364,33 +674,29 @@ def create_enhanced_metrics_by_lag_plot(data, group, metric):
         y_values = []
         y_errors = []
         
-        for lag in lags:
-            if lag in group_data and level_key in group_data[lag]:
-                lag_data = group_data[lag][level_key]
-                
-                if metric in lag_data and 'exp_names' in lag_data:
-                    # Find experiments for this DIV
-                    div_values = []
-                    for exp_idx, exp_name in enumerate(lag_data['exp_names']):
-                        if any(f'DIV{div}' in part for part in exp_name.split('_')):
-                            if exp_idx < len(lag_data[metric]):
-                                div_values.append(lag_data[metric][exp_idx])
-                    
-                    if len(div_values) > 0:
-                        # Filter out NaN values
-                        div_values = [v for v in div_values if v is not None and np.isfinite(v)]
-                        
-                        if len(div_values) > 0:
-                            x_values.append(lag)
-                            y_values.append(np.mean(div_values))
-                            y_errors.append(np.std(div_values) / np.sqrt(len(div_values)))  # SEM
+        for lag, div_index, metric_arr in lag_records:
+            # Experiments for this DIV; NaN/inf are masked out of the reductions
+            positions = div_index.get(div)
+            if positions is None:
+                continue
+            div_values = metric_arr[positions[positions < metric_arr.size]]
+            finite = np.isfinite(div_values)
+            n_finite = np.count_nonzero(finite)
+            
+            if n_finite > 0:
+                # Mean once, then the population std from deviations around it
+                mean_val = np.mean(div_values, where=finite)
+                std_val = np.sqrt(np.mean(np.square(div_values - mean_val), where=finite))
+                x_values.append(lag)
+                y_values.append(mean_val)
+                y_errors.append(std_val / np.sqrt(n_finite))  # SEM
         
         if x_values:
             # Add enhanced line plot
-            fig.add_trace(
+            traces.append(
                 go.Scatter(
-                    x=x_values,
-                    y=y_values,
+                    x=np.asarray(x_values, dtype=np.float32),
+                    y=np.asarray(y_values, dtype=np.float32),
                     mode='lines+markers',
                     name=f'DIV {div}',
                     line=dict(color=color, width=3),
@@ -401,7 +707,7 @@ def create_enhanced_metrics_by_lag_plot(data, group, metric):
                     ),
                     error_y=dict(
                         type='data',
-                        array=y_errors,
+                        array=np.asarray(y_errors, dtype=np.float32),
                         visible=True,
                         color=color,
                         thickness=2,
@@ -411,15 +717,19 @@ def create_enhanced_metrics_by_lag_plot(data, group, metric):
                 )
             )
     
+    if traces:
+        fig.add_traces(traces)
+    
     # Enhanced layout
+    metric_label = get_network_metric_label(metric)
     fig.update_layout(
         title=dict(
-            text=f'<b>{get_network_metric_label(metric)} by Lag Value for Group {group}</b>',
+            text=f'<b>{metric_label} by Lag Value for Group {group}</b>',
             x=0.5,
             font=dict(size=18, color=MODERN_COLORS['text'])
         ),
         xaxis_title="<b>Lag (ms)</b>",
-        yaxis_title=f"<b>{get_network_metric_label(metric)}</b>",
+        yaxis_title=f"<b>{metric_label}</b>",
         height=650,
         plot_bgcolor='white',
         paper_bgcolor=MODERN_COLORS['background'],
@@ -473,18 +783,8 @@ def create_enhanced_node_cartography_plot(data, group, lag, div=None):
         # Create role proportions plot
         fig = go.Figure()
         
-        # Enhanced role colors
-        role_colors = {
-            'Peripheral': '#FF6B6B',
-            'Non-hub connector': '#4ECDC4',
-            'Non-hub kinless': '#45B7D1',
-            'Provincial hub': '#96CEB4',
-            'Connector hub': '#FFEAA7',
-            'Kinless hub': '#DDA0DD'
-        }
-        
         # Get data for the group and lag
-        if group not in data['by_group'] or lag not in data['by_group'][group]:
+        if lag not in data['by_group'].get(group, {}):
             fig.update_layout(
                 title=f"<b>No cartography data available for Group {group}, Lag {lag} ms</b>",
                 height=500,
@@ -494,47 +794,44 @@ def create_enhanced_node_cartography_plot(data, group, lag, div=None):
             )
             return fig
         
-        group_data = data['by_group'][group][lag]
         divs = sorted(data['divs'])
         
-        # For each role, plot proportion across DIVs
-        for role, color in role_colors.items():
-            x_values = []
-            y_values = []
+        # Index experiments by (group, DIV) once instead of rescanning them per DIV
+        exps_by_group_div = _index_experiments_by_group_div(data)
+        
+        # Mean role fractions per DIV over its experiments (each counted once, then cached)
+        plotted_divs = []
+        div_mean_fractions = []
+        for div in divs:
+            exp_fractions = []
             
-            for div in divs:
-                # Find experiments for this DIV
-                div_props = []
-                
-                for exp_name in data['by_experiment']:
-                    exp_data = data['by_experiment'][exp_name]
+            for exp_data in exps_by_group_div.get((group, div), []):
+                if 'lags' in exp_data and lag in exp_data['lags']:
+                    cart_data = exp_data['lags'][lag]
                     
-                    # Check if this experiment matches the group and DIV
-                    if exp_data.get('group') == group and exp_data.get('div') == div:
-                        if 'lags' in exp_data and lag in exp_data['lags']:
-                            cart_data = exp_data['lags'][lag]
-                            
-                            if 'roles' in cart_data:
-                                roles = cart_data['roles']
-                                if isinstance(roles, np.ndarray):
-                                    roles = roles.flatten()
-                                
-                                total_nodes = len(roles)
-                                role_count = sum(1 for r in roles if r == role)
-                                
-                                if total_nodes > 0:
-                                    div_props.append(role_count / total_nodes)
-                
-                if div_props:
-                    x_values.append(div)
-                    y_values.append(np.mean(div_props))
+                    if 'roles' in cart_data:
+                        fractions = _get_role_fractions(cart_data)
+                        if fractions is not None:
+                            exp_fractions.append(fractions)
             
-            if x_values:
+            if exp_fractions:
+                plotted_divs.append(div)
+                div_mean_fractions.append(np.mean(exp_fractions, axis=0))
+        
+        # For each role, plot proportion across DIVs
+        if plotted_divs:
+            x_values = np.asarray(plotted_divs, dtype=np.float32)
+            fraction_table = np.asarray(div_mean_fractions, dtype=np.float32)
+            
+            traces = []
+            for role_idx, role in enumerate(ROLE_ORDER):
+                color = ROLE_COLORS[role]
+                
                 # Add enhanced line plot
-                fig.add_trace(
+                traces.append(
                     go.Scatter(
                         x=x_values,
-                        y=y_values,
+                        y=fraction_table[:, role_idx],
                         mode='lines+markers',
                         name=role,
                         line=dict(color=color, width=3),
@@ -546,6 +843,7 @@ def create_enhanced_node_cartography_plot(data, group, lag, div=None):
                         hovertemplate=f'{role}<br>DIV: %{{x}}<br>Proportion: %{{y:.3f}}<extra></extra>'
                     )
                 )
+            fig.add_traces(traces)
         
         # Enhanced layout
         fig.update_layout(
@@ -596,40 +894,9 @@ def create_enhanced_node_cartography_plot(data, group, lag, div=None):
 
 def get_network_metric_label(metric):
     """Get proper network metric labels with units"""
-    metric_labels = {
-        # Node-level metrics
-        'ND': 'Node Degree',
-        'NS': 'Node Strength', 
-        'MEW': 'Mean Edge Weight',
-        'Eloc': 'Local Efficiency',
-        'BC': 'Betweenness Centrality',
-        'PC': 'Participation Coefficient',
-        'Z': 'Within-Module Z-score',
-        'aveControl': 'Average Controllability',
-        'modalControl': 'Modal Controllability',
-        
-        # Network-level metrics
-        'aN': 'Active Nodes',
-        'Dens': 'Network Density',
-        'NDmean': 'Mean Node Degree',
-        'NDtop25': 'Top 25% Node Degree',
-        'sigEdgesMean': 'Mean Significant Edge Weight',
-        'sigEdgesTop10': 'Top 10% Edge Weight',
-        'NSmean': 'Mean Node Strength',
-        'ElocMean': 'Mean Local Efficiency',
-        'CC': 'Clustering Coefficient',
-        'nMod': 'Number of Modules',
-        'Q': 'Modularity',
-        'PL': 'Path Length',
-        'PCmean': 'Mean Participation Coefficient',
-        'Eglob': 'Global Efficiency',
-        'SW': 'Small-worldness Sigma',
-        'SWw': 'Small-worldness Omega'
-    }
-    
-    return metric_labels.get(metric, metric)
+    return NETWORK_METRIC_LABELS.get(metric, metric)
 
 # Update function names for compatibility
 create_network_half_violin_plot_by_group = create_enhanced_network_half_violin_plot_by_group
 create_metrics_by_lag_plot = create_enhanced_metrics_by_lag_plot
-create_node_cartography_plot = create_enhanced_node_cartography_plot
\ No newline at end of file
+create_node_cartography_plot = create_enhanced_node_cartography_plot
@@ -1,14 +1,16 @@
 # components/neuronal_activity.py - REFACTORED VERSION WITH Y-AXIS CONTROLS
+import logging
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from data_processing.utilities import calculate_half_violin_data, extract_div_value
+from data_processing.utilities import calculate_half_violin_data, extract_div_value, index_experiments_by_div
 from utils.config import get_plot_color, get_plot_fill_color
 from utils.config import is_sparse_metric
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # CONFIGURATION - MEA-NAP MATLAB Style Colors and Settings
 # =============================================================================
@@ -39,6 +41,46 @@ PLOT_CONFIG = {
     'line_width': 1
 }
 
+# Seed of the per-call jitter and subsampling generators, so the same data always renders the same
+JITTER_SEED = 0
+
+# Individual points are jittered this far to the LEFT of their x position
+POINT_JITTER_WIDTH = 0.15
+
+# Point traces with more markers than this use Scattergl
+WEBGL_POINT_THRESHOLD = 1000
+
+# Default cap on the markers drawn per DIV/group series; larger series show a random subset
+MAX_POINT_MARKERS = 5000
+
+# Hover templates for recording-level points, filled in once per series (the by-age
+# plot has never listed the recording number)
+RECORDING_HOVER_SINGLE = '<b>{title}</b><br>Value: %{{y:.3f}}<br>Single Recording<extra></extra>'
+RECORDING_HOVER_MULTI = '<b>{title}</b><br>Value: %{{y:.3f}}<br>Recording %{{pointNumber}}<br>n={n}<extra></extra>'
+RECORDING_HOVER_MULTI_BY_AGE = '<b>{title}</b><br>Value: %{{y:.3f}}<br>n={n}<extra></extra>'
+
+# Metric labels with units
+NEURONAL_METRIC_LABELS = {
+    'FR': 'Firing Rate (Hz)',
+    'FRActiveNode': 'Mean Firing Rate Active Node (Hz)',
+    'channelBurstRate': 'Burst Rate (per minute)',
+    'channelBurstDur': 'Burst Duration (ms)',
+    'channelISIwithinBurst': 'ISI Within Burst (ms)',
+    'channeISIoutsideBurst': 'ISI Outside Burst (ms)',
+    'channelFracSpikesInBursts': 'Fraction Spikes in Bursts',
+    'channelFRinBurst': 'Within-Burst Firing Rate (Hz)',
+    'numActiveElec': 'Number of Active Electrodes',
+    'FRmean': 'Mean Firing Rate (Hz)',
+    'FRmedian': 'Median Firing Rate (Hz)',
+    'NBurstRate': 'Network Burst Rate (per minute)',
+    'meanNumChansInvolvedInNbursts': 'Mean Channels in Network Bursts',
+    'meanNBstLengthS': 'Mean Network Burst Length (s)',
+    'meanISIWithinNbursts_ms': 'Mean ISI Within Network Bursts (ms)',
+    'meanISIoutsideNbursts_ms': 'Mean ISI Outside Network Bursts (ms)',
+    'CVofINBI': 'CV of Inter-Network-Burst Intervals',
+    'fracInNburst': 'Fraction of Spikes in Network Bursts'
+}
+
 # =============================================================================
 # UTILITY FUNCTIONS - Data Processing and Preparation
 # =============================================================================
@@ -56,23 +98,25 @@ def prepare_data_for_plotting(data, metric, groups, selected_divs, comparison_ty
         selected_divs: Selected DIVs
         comparison_type: Type of comparison ('nodebygroup', 'nodebyage', etc.)
     """
-    print(f"🔧 Preparing data for plotting: {metric} ({comparison_type})")
+    logger.debug("Preparing data for plotting: %s (%s)", metric, comparison_type)
     
     # Filter DIVs
     if selected_divs:
-        filtered_divs = [d for d in selected_divs if d in data['divs']]
+        available_divs = set(data['divs'])
+        filtered_divs = [d for d in selected_divs if d in available_divs]
     else:
         filtered_divs = sorted(data['divs'])
     
     # Filter groups
     if groups:
-        filtered_groups = [g for g in groups if g in data['groups']]
+        available_groups = set(data['groups'])
+        filtered_groups = [g for g in groups if g in available_groups]
     else:
         filtered_groups = data['groups']
     
     # ALL COMPARISONS now use by_group structure
     # The difference is in the visualization, not the data preparation
-    print(f"   Using by_group data structure for all comparison types")
+    logger.debug("Using by_group data structure for all comparison types")
     
     # Organize data by group and DIV
     plot_data = {}
@@ -87,6 +131,9 @@ def prepare_data_for_plotting(data, metric, groups, selected_divs, comparison_ty
         
         plot_data[group] = {}
         
+        # Positions of each DIV's experiments, from their loaded DIVs (or names)
+        div_positions = index_experiments_by_div(group_data.get('exp_names', []), data.get('by_experiment'))
+        
         # For each DIV, extract the relevant data
         for div in filtered_divs:
             div_values = []
@@ -94,14 +141,17 @@ def prepare_data_for_plotting(data, metric, groups, selected_divs, comparison_ty
             # Check if this is recording-level data (has exp_names)
             if 'exp_names' in group_data and len(group_data['exp_names']) > 0:
                 # Extract values for this specific DIV
-                for i, exp_name in enumerate(group_data['exp_names']):
-                    if f'DIV{div}' in exp_name:
-                        if i < len(group_data[metric]):
-                            value = group_data[metric][i]
-                            if isinstance(value, (list, np.ndarray)):
-                                div_values.extend(value)
-                            else:
-                                div_values.append(value)
+                metric_values = group_data[metric]
+                if isinstance(metric_values, np.ndarray) and metric_values.dtype != object:
+                    # Numeric arrays gather every experiment of this DIV in one indexing step
+                    positions = np.asarray(div_positions.get(div, ()), dtype=np.intp)
+                    div_values = metric_values[positions[positions < len(metric_values)]]
+                else:
+                    # Flatten each experiment into a chunk and join them with one concatenate
+                    chunks = [np.asarray(metric_values[i], dtype=float).ravel()
+                              for i in div_positions.get(div, ()) if i < len(metric_values)]
+                    if chunks:
+                        div_values = np.concatenate(chunks)
                 
                 # If no DIV-specific data found, use all data (fallback)
                 if len(div_values) == 0:
@@ -110,11 +160,10 @@ def prepare_data_for_plotting(data, metric, groups, selected_divs, comparison_ty
                 # For electrode-level data, use all values
                 div_values = group_data[metric]
             
-            # Clean the data
+            # Clean the data (None converts to NaN and is dropped with the other non-finite values)
             if isinstance(div_values, (list, np.ndarray)):
-                if isinstance(div_values, np.ndarray):
-                    div_values = div_values.tolist()
-                clean_values = [v for v in div_values if v is not None and np.isfinite(v)]
+                values = np.asarray(div_values, dtype=float).ravel()
+                clean_values = values[np.isfinite(values)].tolist()
             else:
                 clean_values = [div_values] if div_values is not None and np.isfinite(div_values) else []
             
@@ -138,10 +187,10 @@ def calculate_y_range(plot_data, y_range_mode='auto', y_min=None, y_max=None):
     
     if y_range_mode == 'manual' and y_min is not None and y_max is not None:
         if y_min < y_max:
-            print(f"   📊 Using manual Y-range: [{y_min}, {y_max}]")
+            logger.debug("Using manual Y-range: [%s, %s]", y_min, y_max)
             return y_min, y_max
         else:
-            print(f"⚠️ Invalid Y-range: min({y_min}) >= max({y_max}), using auto range")
+            logger.warning("Invalid Y-range: min(%s) >= max(%s), using auto range", y_min, y_max)
     
     # AUTO RANGE CALCULATION
     all_values = []
@@ -165,40 +214,157 @@ def calculate_y_range(plot_data, y_range_mode='auto', y_min=None, y_max=None):
         y_max_auto = 1
         y_min_auto = 0
     
-    print(f"   📊 Using auto Y-range: [{y_min_auto:.2f}, {y_max_auto:.2f}]")
+    logger.debug("Using auto Y-range: [%.2f, %.2f]", y_min_auto, y_max_auto)
     return y_min_auto, y_max_auto
 
 def get_metric_label(metric):
     """Get proper metric labels with units"""
-    metric_labels = {
-        'FR': 'Firing Rate (Hz)',
-        'FRActiveNode': 'Mean Firing Rate Active Node (Hz)',
-        'channelBurstRate': 'Burst Rate (per minute)',
-        'channelBurstDur': 'Burst Duration (ms)',
-        'channelISIwithinBurst': 'ISI Within Burst (ms)',
-        'channeISIoutsideBurst': 'ISI Outside Burst (ms)',
-        'channelFracSpikesInBursts': 'Fraction Spikes in Bursts',
-        'channelFRinBurst': 'Within-Burst Firing Rate (Hz)',
-        'numActiveElec': 'Number of Active Electrodes',
-        'FRmean': 'Mean Firing Rate (Hz)',
-        'FRmedian': 'Median Firing Rate (Hz)',
-        'NBurstRate': 'Network Burst Rate (per minute)',
-        'meanNumChansInvolvedInNbursts': 'Mean Channels in Network Bursts',
-        'meanNBstLengthS': 'Mean Network Burst Length (s)',
-        'meanISIWithinNbursts_ms': 'Mean ISI Within Network Bursts (ms)',
-        'meanISIoutsideNbursts_ms': 'Mean ISI Outside Network Bursts (ms)',
-        'CVofINBI': 'CV of Inter-Network-Burst Intervals',
-        'fracInNburst': 'Fraction of Spikes in Network Bursts'
-    }
-    
-    return metric_labels.get(metric, metric)
+    return NEURONAL_METRIC_LABELS.get(metric, metric)
+
+def _build_point_and_summary_traces(point_series, summary_series, show_legend, max_markers=MAX_POINT_MARKERS):
+    """
+    Build one subplot's individual points, one trace per series, and its mean/SEM marks as one trace
+    
+    point_series holds (x_base, y, color, legend_name, hover_title) per DIV or group, and
+    summary_series holds (x_base, mean, sem, hover_text) with sem None for single values.
+    Each point trace carries its series' legend entry and legendgroup, so the legend toggles
+    that series' points in every subplot. The jitter for every point of the subplot is drawn
+    in one call. A series with more than max_markers values (None for no limit) draws a
+    random subset of them; the hover still reports the full n.
+    """
+    traces = []
+    point_marker = dict(size=6, opacity=0.8, line=dict(width=1, color='black'))  # MEA-NAP size scaled for Plotly
+    
+    if point_series:
+        rng = np.random.default_rng(JITTER_SEED)
+        counts = [len(y) for _, y, _, _, _ in point_series]
+        # Position within its own series of every point that is drawn, for the hover
+        shown = [np.arange(n) if max_markers is None or n <= max_markers
+                 else np.sort(rng.choice(n, max_markers, replace=False))
+                 for n in counts]
+        shown_counts = np.array([len(index) for index in shown])
+        total = int(shown_counts.sum())
+        point_x = np.repeat(np.array([x_base for x_base, _, _, _, _ in point_series], dtype=np.float32), shown_counts)
+        point_x += rng.uniform(-POINT_JITTER_WIDTH, 0, size=total).astype(np.float32)  # LEFT side only
+        
+        # Large node-level subplots are drawn with WebGL instead of one SVG node per marker
+        scatter_cls = go.Scattergl if total > WEBGL_POINT_THRESHOLD else go.Scatter
+        series_x = np.split(point_x, np.cumsum(shown_counts)[:-1])
+        for (_, y, color, legend_name, hover_title), n, index, x in zip(point_series, counts, shown, series_x):
+            traces.append(
+                scatter_cls(
+                    x=x,
+                    y=np.asarray(y, dtype=np.float32)[index],
+                    mode='markers',
+                    marker=dict(point_marker, color=color),
+                    customdata=index,
+                    name=legend_name,
+                    legendgroup=legend_name,
+                    showlegend=show_legend,
+                    hovertemplate=f'<b>{hover_title}</b><br>Value: %{{y:.3f}}<br>Electrode %{{customdata}}<br>n={n}<extra></extra>'
+                )
+            )
+    
+    if summary_series:
+        # SEM bars run through their mean and only the mean gets a marker; None breaks the line
+        summary_x, summary_y, marker_sizes, hover_texts = [], [], [], []
+        for x_base, mean_value, sem_value, hover_text in summary_series:
+            if sem_value is None:
+                segment_y = [mean_value]
+                segment_sizes = [12]
+            else:
+                segment_y = [mean_value - sem_value, mean_value, mean_value + sem_value]
+                segment_sizes = [0, 12, 0]
+            summary_x += [x_base] * len(segment_y) + [None]
+            summary_y += segment_y + [None]
+            marker_sizes += segment_sizes + [0]
+            hover_texts += [hover_text] * len(segment_y) + ['']
+        
+        traces.append(
+            go.Scatter(
+                x=summary_x,
+                y=summary_y,
+                mode='lines+markers',
+                line=dict(color='black', width=3),  # MEA-NAP: 3px width
+                marker=dict(
+                    color='black',  # MEA-NAP: pure black
+                    size=marker_sizes,
+                    opacity=1.0,
+                    line=dict(width=[2 if size else 0 for size in marker_sizes], color='black')
+                ),
+                text=hover_texts,
+                showlegend=False,
+                hovertemplate='%{text}<extra></extra>'
+            )
+        )
+    
+    return traces
+
+def _collect_half_violin_series(values, x_base, color, fill_color, legend_name, hover_title,
+                                point_series, summary_series):
+    """
+    Queue one DIV's or group's points and mean/SEM marks and build its half violin
+    
+    The by-group and by-age plots only differ in what x_base and the colors stand for.
+    values is the cleaned float array. Returns the filled violin outline drawn on the
+    RIGHT of x_base, or None when there are fewer than two values or the KDE fails.
+    """
+    # 1. INDIVIDUAL DATA POINTS (LEFT side with jitter)
+    point_series.append((x_base, values, color, legend_name, hover_title))
+    
+    # 2. HALF VIOLIN PLOT (RIGHT side) - ALWAYS SHOWN like MEA-NAP
+    outline = None
+    if len(values) >= 2:  # MEA-NAP minimum: n > 1
+        try:
+            kde_data = calculate_half_violin_data(values)
+            x_data = kde_data.get('x')
+            y_data = kde_data.get('y')
+            
+            if x_data is not None and y_data is not None and len(x_data) > 0:
+                x_data = np.asarray(x_data, dtype=np.float32)
+                y_data = np.asarray(y_data, dtype=np.float32)
+                
+                # MEA-NAP specification: violin on RIGHT side of x-axis center
+                violin_width = 0.3
+                max_density = y_data.max() if len(y_data) > 0 else 1
+                violin_x = x_base + 0.1 + (y_data / max_density) * violin_width  # RIGHT side: +0.1 offset
+                
+                # Create filled violin shape
+                outline = go.Scatter(
+                    x=np.concatenate([violin_x, np.full(len(violin_x), x_base + 0.1, dtype=np.float32)]),  # Close the shape
+                    y=np.concatenate([x_data, x_data[::-1]]),  # Mirror for closing
+                    fill='toself',
+                    fillcolor=fill_color,
+                    line=dict(color=color, width=1),
+                    mode='lines',
+                    showlegend=False,
+                    hoverinfo='skip'
+                )
+        
+        except Exception as e:
+            logger.warning("Violin plot failed for %s (n=%d): %s", hover_title, len(values), e)
+            # Continue without violin - individual points still shown
+    
+    # 3. MEAN INDICATOR (CENTER) and 4. ERROR BARS (SEM, not std) - MEA-NAP specification
+    try:
+        mean_value = np.mean(values)
+        sem_value = np.std(values) / np.sqrt(len(values)) if len(values) > 1 else None
+        summary_series.append((
+            x_base, mean_value, sem_value,
+            f'<b>Mean: {mean_value:.3f}</b><br>n={len(values)} electrodes'
+        ))
+    
+    except Exception as e:
+        logger.warning("Mean calculation failed for %s: %s", hover_title, e)
+    
+    return outline
 
 # =============================================================================
 # PLOT TYPE FUNCTIONS - Individual plot creators WITH Y-AXIS SUPPORT
 # =============================================================================
 
 def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metric, title, neuronal_data=None,
-                                y_range_mode='auto', y_min=None, y_max=None):
+                                y_range_mode='auto', y_min=None, y_max=None, max_markers=MAX_POINT_MARKERS):
     """
     Create violin plot that matches MEA-NAP behavior with proper colors and Y-axis controls
     
@@ -216,11 +382,19 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
     total_data_points = 0
     groups_with_data = set()
     
+    # Every subplot's traces are added to the figure in one call after the loop
+    traces = []
+    trace_cols = []
+    
     for col, group in enumerate(filtered_groups, 1):
         group_has_data = False
         
         if group not in plot_data:
             continue
+        
+        # Points and mean/SEM marks of every DIV are drawn together after the loop
+        point_series = []
+        summary_series = []
             
         for div_idx, div in enumerate(filtered_divs):
             if div not in plot_data[group]:
@@ -235,9 +409,13 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
             group_has_data = True
             groups_with_data.add(group)
             
+            # One float array serves the max, the points, the KDE and the mean below;
+            # prepare_data_for_plotting already dropped the non-finite values
+            div_values = np.asarray(div_values, dtype=float)
+            
             # Track statistics
             try:
-                current_max = max(div_values)
+                current_max = float(div_values.max())
                 max_y = max(max_y, current_max)
                 total_data_points += len(div_values)
             except (ValueError, TypeError):
@@ -255,106 +433,19 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
             x_base = div_idx + 1
             
             # MEA-NAP APPROACH: ALWAYS SHOW VIOLIN + INDIVIDUAL POINTS
-            
-            # 1. INDIVIDUAL DATA POINTS (LEFT side with jitter)
-            jitter_width = 0.15
-            jitter = np.random.uniform(-jitter_width, 0, size=len(div_values))  # LEFT side only
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[x_base + j for j in jitter],
-                    y=div_values,
-                    mode='markers',
-                    marker=dict(
-                        color=color,
-                        size=6,  # MEA-NAP size scaled down for Plotly
-                        opacity=0.8,
-                        line=dict(width=1, color='black')
-                    ),
-                    name=f'DIV {div}',
-                    legendgroup=f'DIV {div}',
-                    showlegend=(col == 1),
-                    hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Electrode %{{pointNumber}}<br>n={len(div_values)}<extra></extra>'
-                ),
-                row=1, col=col
-            )
-            
-            # 2. HALF VIOLIN PLOT (RIGHT side) - ALWAYS SHOWN like MEA-NAP
-            if len(div_values) >= 2:  # MEA-NAP minimum: n > 1
-                try:
-                    # Use our existing KDE calculation but improve it
-                    kde_data = calculate_half_violin_data(div_values)
-                    x_data = kde_data.get('x')
-                    y_data = kde_data.get('y')
-                    
-                    if x_data is not None and y_data is not None and len(x_data) > 0:
-                        if isinstance(x_data, np.ndarray):
-                            x_data = x_data.tolist()
-                        if isinstance(y_data, np.ndarray):
-                            y_data = y_data.tolist()
-                        
-                        # MEA-NAP specification: violin on RIGHT side of x-axis center
-                        violin_width = 0.3
-                        max_density = max(y_data) if len(y_data) > 0 else 1
-                        scaled_density = [(d / max_density) * violin_width for d in y_data]
-                        violin_x = [x_base + 0.1 + d for d in scaled_density]  # RIGHT side: +0.1 offset
-                        
-                        # Create filled violin shape
-                        fig.add_trace(
-                            go.Scatter(
-                                x=violin_x + [x_base + 0.1] * len(violin_x),  # Close the shape
-                                y=x_data + x_data[::-1],  # Mirror for closing
-                                fill='toself',
-                                fillcolor=fill_color,
-                                line=dict(color=color, width=1),
-                                mode='lines',
-                                showlegend=False,
-                                hoverinfo='skip'
-                            ),
-                            row=1, col=col
-                        )
-                
-                except Exception as e:
-                    print(f"⚠️ Violin plot failed for {group} DIV {div} (n={len(div_values)}): {e}")
-                    # Continue without violin - individual points still shown
-            
-            # 3. MEAN INDICATOR (CENTER) - MEA-NAP specification
-            try:
-                mean_value = np.mean(div_values)
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base],
-                        y=[mean_value],
-                        mode='markers',
-                        marker=dict(
-                            color='black',  # MEA-NAP: pure black
-                            size=12,  # MEA-NAP: size 100 scaled down for Plotly
-                            opacity=1.0,
-                            line=dict(width=2, color='black')
-                        ),
-                        showlegend=False,
-                        hovertemplate=f'<b>Mean: {mean_value:.3f}</b><br>n={len(div_values)} electrodes<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                
-                # 4. ERROR BARS (SEM, not std) - MEA-NAP specification
-                if len(div_values) > 1:
-                    sem_value = np.std(div_values) / np.sqrt(len(div_values))
-                    fig.add_trace(
-                        go.Scatter(
-                            x=[x_base, x_base],
-                            y=[mean_value - sem_value, mean_value + sem_value],
-                            mode='lines',
-                            line=dict(color='black', width=3),  # MEA-NAP: 3px width
-                            showlegend=False,
-                            hoverinfo='skip'
-                        ),
-                        row=1, col=col
-                    )
-                
-            except Exception as e:
-                print(f"⚠️ Mean calculation failed for {group} DIV {div}: {e}")
+            outline = _collect_half_violin_series(div_values, x_base, color, fill_color, f'DIV {div}',
+                                                  f'{group} - DIV {div}', point_series, summary_series)
+            if outline is not None:
+                traces.append(outline)
+                trace_cols.append(col)
+        
+        subplot_traces = _build_point_and_summary_traces(point_series, summary_series, show_legend=(col == 1),
+                                                         max_markers=max_markers)
+        traces += subplot_traces
+        trace_cols += [col] * len(subplot_traces)
+    
+    if traces:
+        fig.add_traces(traces, rows=[1] * len(traces), cols=trace_cols)
     
     # Add "No Data" annotations for completely empty groups
     for col, group in enumerate(filtered_groups, 1):
@@ -377,23 +468,22 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
         paper_bgcolor='white',
         font=dict(family='Arial', size=12, color='black'),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode='closest', hoverdistance=20, spikedistance=20,  # bounded hover search over dense points
         margin=dict(b=60, t=100, l=60, r=60)
     )
     
     # APPLY Y-AXIS CONTROLS
     y_min_final, y_max_final = calculate_y_range(plot_data, y_range_mode, y_min, y_max)
     
-    # Update axes
-    for col in range(1, len(filtered_groups) + 1):
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_divs) + 1)),
-            ticktext=[str(div) for div in filtered_divs],
-            title_text="Age" if col == len(filtered_groups)//2 + 1 else "",
-            showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
-            linecolor='black', linewidth=1,
-            range=[0.5, len(filtered_divs) + 0.5],
-            row=1, col=col
-        )
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_divs) + 1)),
+        ticktext=[str(div) for div in filtered_divs],
+        showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
+        linecolor='black', linewidth=1,
+        range=[0.5, len(filtered_divs) + 0.5]
+    )
+    fig.update_xaxes(title_text="Age", row=1, col=len(filtered_groups)//2 + 1)
     
     fig.update_yaxes(
         title_text=get_metric_label(metric),
@@ -403,8 +493,8 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
         zeroline=True, zerolinecolor='rgba(200,200,200,0.5)'
     )
     
-    print(f"   ✅ Created MEA-NAP style plot: {total_data_points} data points across {len(filtered_groups)} groups")
-    print(f"   📊 Y-axis range: [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created MEA-NAP style plot: %d data points across %d groups", total_data_points, len(filtered_groups))
+    logger.debug("Y-axis range: [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     
     return fig
 
@@ -413,7 +503,7 @@ def create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metri
 # =============================================================================
 
 def create_half_violin_plot_by_group(data, metric, title, selected_groups=None, selected_divs=None,
-                                     y_range_mode='auto', y_min=None, y_max=None):
+                                     y_range_mode='auto', y_min=None, y_max=None, max_markers=MAX_POINT_MARKERS):
     """
     Create MEA-NAP style violin plot organized by group with proper color scheme and Y-axis controls
     
@@ -426,6 +516,7 @@ def create_half_violin_plot_by_group(data, metric, title, selected_groups=None,
         y_range_mode: 'auto' or 'manual'
         y_min: Manual minimum Y value
         y_max: Manual maximum Y value
+        max_markers: Most points drawn per DIV (None draws every point)
         
     Returns:
         Plotly figure
@@ -436,17 +527,17 @@ def create_half_violin_plot_by_group(data, metric, title, selected_groups=None,
     
     # Create violin plot with neuronal data for color determination and Y-axis controls
     return create_violin_plot_by_group(plot_data, filtered_groups, filtered_divs, metric, title, neuronal_data=data,
-                                      y_range_mode=y_range_mode, y_min=y_min, y_max=y_max)
+                                      y_range_mode=y_range_mode, y_min=y_min, y_max=y_max, max_markers=max_markers)
 
 def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, selected_divs=None,
-                                  y_range_mode='auto', y_min=None, y_max=None):
+                                  y_range_mode='auto', y_min=None, y_max=None, max_markers=MAX_POINT_MARKERS):
     """
     Create MEA-NAP style violin plot organized by age with Y-axis controls
     Shows separate subplot for each age, with groups compared within each age
     
     MEA-NAP Logic: X-axis shows groups → Colors represent groups (group colors)
     """
-    print(f"🎨 Creating MEA-NAP style violin plot by age for {metric}")
+    logger.debug("Creating MEA-NAP style violin plot by age for %s", metric)
     
     # Prepare data using by_group structure
     plot_data, filtered_groups, filtered_divs = prepare_data_for_plotting(
@@ -464,10 +555,18 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
     max_y = 0
     total_data_points = 0
     
+    # Every subplot's traces are added to the figure in one call after the loop
+    traces = []
+    trace_cols = []
+    
     # For each DIV (age), create a group comparison subplot
     for col, div in enumerate(filtered_divs, 1):
         div_has_data = False
         
+        # Points and mean/SEM marks of every group are drawn together after the loop
+        point_series = []
+        summary_series = []
+        
         # Within this DIV, show all groups on X-axis
         for group_idx, group in enumerate(filtered_groups):
             if group not in plot_data or div not in plot_data[group]:
@@ -479,9 +578,13 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
             
             div_has_data = True
             
+            # One float array serves the max, the points, the KDE and the mean below;
+            # prepare_data_for_plotting already dropped the non-finite values
+            div_values = np.asarray(div_values, dtype=float)
+            
             # Track statistics
             try:
-                current_max = max(div_values)
+                current_max = float(div_values.max())
                 max_y = max(max_y, current_max)
                 total_data_points += len(div_values)
             except (ValueError, TypeError):
@@ -494,117 +597,16 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
             x_base = group_idx + 1  # X-position for this group
             
             # MEA-NAP APPROACH: ALWAYS SHOW VIOLIN + INDIVIDUAL POINTS
-            
-            # 1. INDIVIDUAL DATA POINTS (LEFT side with jitter)
-            jitter_width = 0.15
-            jitter = np.random.uniform(-jitter_width, 0, size=len(div_values))  # LEFT side only
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=[x_base + j for j in jitter],
-                    y=div_values,
-                    mode='markers',
-                    marker=dict(
-                        color=color,
-                        size=6,  # MEA-NAP size scaled for Plotly
-                        opacity=0.8,
-                        line=dict(width=1, color='black')
-                    ),
-                    name=f'{group}',
-                    legendgroup=f'{group}',
-                    showlegend=(col == 1),  # Only show legend for first subplot
-                    hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Electrode %{{pointNumber}}<br>n={len(div_values)}<extra></extra>'
-                ),
-                row=1, col=col
-            )
-            
-            # 2. HALF VIOLIN PLOT (RIGHT side) - ALWAYS SHOWN like MEA-NAP
-            if len(div_values) >= 2:  # MEA-NAP minimum: n > 1
-                try:
-                    # Use our existing KDE calculation
-                    kde_data = calculate_half_violin_data(div_values)
-                    x_data = kde_data.get('x')
-                    y_data = kde_data.get('y')
-                    
-                    if x_data is not None and y_data is not None and len(x_data) > 0:
-                        if isinstance(x_data, np.ndarray):
-                            x_data = x_data.tolist()
-                        if isinstance(y_data, np.ndarray):
-                            y_data = y_data.tolist()
-                        
-                        # MEA-NAP specification: violin on RIGHT side of x-axis center
-                        violin_width = 0.3
-                        max_density = max(y_data) if len(y_data) > 0 else 1
-                        scaled_density = [(d / max_density) * violin_width for d in y_data]
-                        violin_x = [x_base + 0.1 + d for d in scaled_density]  # RIGHT side: +0.1 offset
-                        
-                        # Create filled violin shape
-                        fig.add_trace(
-                            go.Scatter(
-                                x=violin_x + [x_base + 0.1] * len(violin_x),  # Close the shape
-                                y=x_data + x_data[::-1],  # Mirror for closing
-                                fill='toself',
-                                fillcolor=fill_color,
-                                line=dict(color=color, width=1),
-                                mode='lines',
-                                showlegend=False,
-                                hoverinfo='skip'
-                            ),
-                            row=1, col=col
-                        )
-                
-                except Exception as e:
-                    print(f"⚠️ Violin plot failed for {group} DIV {div} (n={len(div_values)}): {e}")
-                    # Continue without violin - individual points still shown
-            
-            # 3. MEAN INDICATOR (CENTER) - MEA-NAP specification
-            try:
-                mean_value = np.mean(div_values)
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base],
-                        y=[mean_value],
-                        mode='markers',
-                        marker=dict(
-                            color='black',  # MEA-NAP: pure black
-                            size=12,  # MEA-NAP size scaled for Plotly
-                            opacity=1.0,
-                            line=dict(width=2, color='black')
-                        ),
-                        showlegend=False,
-                        hovertemplate=f'<b>Mean: {mean_value:.3f}</b><br>n={len(div_values)} electrodes<extra></extra>'
-                    ),
-                    row=1, col=col
-                )
-                
-                # 4. ERROR BARS (SEM, not std) - MEA-NAP specification
-                if len(div_values) > 1:
-                    sem_value = np.std(div_values) / np.sqrt(len(div_values))
-                    fig.add_trace(
-                        go.Scatter(
-                            x=[x_base, x_base],
-                            y=[mean_value - sem_value, mean_value + sem_value],
-                            mode='lines',
-                            line=dict(color='black', width=3),  # MEA-NAP: 3px width
-                            showlegend=False,
-                            hoverinfo='skip'
-                        ),
-                        row=1, col=col
-                    )
-                
-            except Exception as e:
-                print(f"⚠️ Mean calculation failed for {group} DIV {div}: {e}")
+            outline = _collect_half_violin_series(div_values, x_base, color, fill_color, f'{group}',
+                                                  f'{group} - DIV {div}', point_series, summary_series)
+            if outline is not None:
+                traces.append(outline)
+                trace_cols.append(col)
         
-        # Update x-axis for this subplot to show group names
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_groups) + 1)),
-            ticktext=filtered_groups,
-            title_text="Group" if col == len(filtered_divs)//2 + 1 else "",
-            showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
-            linecolor='black', linewidth=1,
-            range=[0.5, len(filtered_groups) + 0.5],
-            row=1, col=col
-        )
+        subplot_traces = _build_point_and_summary_traces(point_series, summary_series, show_legend=(col == 1),
+                                                         max_markers=max_markers)
+        traces += subplot_traces
+        trace_cols += [col] * len(subplot_traces)
         
         # Add "No Data" annotation for empty age subplots
         if not div_has_data:
@@ -618,6 +620,19 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
                 row=1, col=col
             )
     
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_groups) + 1)),
+        ticktext=filtered_groups,
+        showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
+        linecolor='black', linewidth=1,
+        range=[0.5, len(filtered_groups) + 0.5]
+    )
+    fig.update_xaxes(title_text="Group", row=1, col=len(filtered_divs)//2 + 1)
+    
+    if traces:
+        fig.add_traces(traces, rows=[1] * len(traces), cols=trace_cols)
+    
     # Layout matching MEA-NAP style
     annotations = []
     annotations.append(
@@ -639,6 +654,7 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
         font=dict(family='Arial', size=12, color='black'),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         annotations=annotations,
+        hovermode='closest', hoverdistance=20, spikedistance=20,  # bounded hover search over dense points
         margin=dict(b=60, t=120, l=60, r=60)
     )
     
@@ -654,8 +670,8 @@ def create_half_violin_plot_by_age(data, metric, title, selected_groups=None, se
         zeroline=True, zerolinecolor='rgba(200,200,200,0.5)'
     )
     
-    print(f"   ✅ Created MEA-NAP style Node by Age plot: {total_data_points} total data points across {len(filtered_divs)} age subplots")
-    print(f"   📊 Y-axis range: [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created MEA-NAP style Node by Age plot: %d total data points across %d age subplots", total_data_points, len(filtered_divs))
+    logger.debug("Y-axis range: [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     
     return fig
 
@@ -665,7 +681,7 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
     Create recording-level violin plot organized by group with MEA-NAP colors and Y-axis controls
     Recording by Group: X-axis shows ages → Colors represent ages (viridis)
     """
-    print(f"🎭 Creating RECORDING-LEVEL violin plot by group for {metric}")
+    logger.debug("Creating recording-level violin plot by group for %s", metric)
     
     # Prepare data for plotting
     plot_data, filtered_groups, filtered_divs = prepare_data_for_plotting(
@@ -684,12 +700,20 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
     total_recordings = 0
     groups_with_data = set()
     
+    # Jitter comes from a generator seeded per call, so re-renders place points identically
+    rng = np.random.default_rng(JITTER_SEED)
+    
+    # Every subplot's traces are added to the figure in one call after the loop
+    traces = []
+    trace_cols = []
+    
     for col, group in enumerate(filtered_groups, 1):
         group_has_data = False
         
         if group not in plot_data:
             continue
-            
+        
+        mean_x, mean_y, mean_n = [], [], []
         for div_idx, div in enumerate(filtered_divs):
             if div not in plot_data[group]:
                 continue
@@ -703,7 +727,7 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
             groups_with_data.add(group)
             
             try:
-                current_max = max(recording_values)
+                current_max = float(np.nanmax(recording_values))
                 max_y = max(max_y, current_max)
                 total_recordings += len(recording_values)
             except (ValueError, TypeError):
@@ -715,9 +739,11 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
             
             x_base = div_idx + 1
             
+            hover_title = f'{group} - DIV {div}'
+            
             # Recording-level visualization (fewer points, more prominent)
             if len(recording_values) == 1:
-                fig.add_trace(
+                traces.append(
                     go.Scatter(
                         x=[x_base],
                         y=recording_values,
@@ -732,16 +758,16 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
                         name=f'DIV {div}',
                         legendgroup=f'DIV {div}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Single Recording<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_SINGLE.format(title=hover_title)
+                    )
                 )
+                trace_cols.append(col)
                 
             elif len(recording_values) <= 3:
-                jitter = np.random.normal(0, 0.12, size=len(recording_values))
-                fig.add_trace(
+                jitter = rng.normal(0, 0.12, size=len(recording_values))
+                traces.append(
                     go.Scatter(
-                        x=[x_base + j for j in jitter],
+                        x=x_base + jitter,
                         y=recording_values,
                         mode='markers',
                         marker=dict(
@@ -754,16 +780,16 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
                         name=f'DIV {div}',
                         legendgroup=f'DIV {div}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Recording %{{pointNumber}}<br>n={len(recording_values)}<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_MULTI.format(title=hover_title, n=len(recording_values))
+                    )
                 )
+                trace_cols.append(col)
                 
             else:
-                jitter = np.random.normal(0, 0.06, size=len(recording_values))
-                fig.add_trace(
+                jitter = rng.normal(0, 0.06, size=len(recording_values))
+                traces.append(
                     go.Scatter(
-                        x=[x_base + j for j in jitter],
+                        x=x_base + jitter,
                         y=recording_values,
                         mode='markers',
                         marker=dict(
@@ -775,10 +801,10 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
                         name=f'DIV {div}',
                         legendgroup=f'DIV {div}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Recording %{{pointNumber}}<br>n={len(recording_values)}<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_MULTI.format(title=hover_title, n=len(recording_values))
+                    )
                 )
+                trace_cols.append(col)
                 
                 # Add violin if enough recordings
                 if len(recording_values) >= 4:
@@ -786,12 +812,11 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
                         kde_data = calculate_half_violin_data(recording_values)
                         x_data = kde_data.get('x')
                         if x_data is not None and len(x_data) > 0:
-                            if isinstance(x_data, np.ndarray):
-                                x_data = x_data.tolist()
+                            x_data = np.asarray(x_data, dtype=np.float32)
                             
-                            fig.add_trace(
+                            traces.append(
                                 go.Violin(
-                                    x=[x_base] * len(x_data),
+                                    x0=x_base,
                                     y=x_data,
                                     width=0.8,
                                     side='both',
@@ -801,34 +826,40 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
                                     meanline_visible=False,
                                     showlegend=False,
                                     hoverinfo='skip'
-                                ),
-                                row=1, col=col
+                                )
                             )
+                            trace_cols.append(col)
                     except Exception as e:
-                        print(f"⚠️ Violin plot failed for {group} DIV {div}: {e}")
+                        logger.warning("Violin plot failed for %s DIV %s: %s", group, div, e)
             
-            # Add mean indicator
-            try:
-                mean_value = np.mean(recording_values)
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base],
-                        y=[mean_value],
-                        mode='markers',
-                        marker=dict(
-                            color='red',
-                            size=10,
-                            opacity=1.0,
-                            line=dict(width=2, color='black'),
-                            symbol='x'
-                        ),
-                        showlegend=False,
-                        hovertemplate=f'<b>Mean: {mean_value:.3f}</b><br>n={len(recording_values)} recordings<extra></extra>'
+            # Mean indicator, drawn with the rest of this subplot's means below
+            mean_x.append(x_base)
+            mean_y.append(float(np.mean(recording_values)))
+            mean_n.append(len(recording_values))
+        
+        # One marker trace holds every mean indicator of the subplot
+        if mean_x:
+            traces.append(
+                go.Scatter(
+                    x=mean_x,
+                    y=mean_y,
+                    customdata=mean_n,
+                    mode='markers',
+                    marker=dict(
+                        color='red',
+                        size=10,
+                        opacity=1.0,
+                        line=dict(width=2, color='black'),
+                        symbol='x'
                     ),
-                    row=1, col=col
+                    showlegend=False,
+                    hovertemplate='<b>Mean: %{y:.3f}</b><br>n=%{customdata} recordings<extra></extra>'
                 )
-            except Exception as e:
-                print(f"⚠️ Mean calculation failed for {group} DIV {div}: {e}")
+            )
+            trace_cols.append(col)
+    
+    if traces:
+        fig.add_traces(traces, rows=[1] * len(traces), cols=trace_cols)
     
     # Add "No Data" annotations for empty groups
     for col, group in enumerate(filtered_groups, 1):
@@ -870,17 +901,15 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
     # APPLY Y-AXIS CONTROLS
     y_min_final, y_max_final = calculate_y_range(plot_data, y_range_mode, y_min, y_max)
     
-    # Update axes
-    for col in range(1, len(filtered_groups) + 1):
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_divs) + 1)),
-            ticktext=[str(div) for div in filtered_divs],
-            title_text="Age" if col == len(filtered_groups)//2 + 1 else "",
-            showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
-            linecolor='black', linewidth=1,
-            range=[0.5, len(filtered_divs) + 0.5],
-            row=1, col=col
-        )
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_divs) + 1)),
+        ticktext=[str(div) for div in filtered_divs],
+        showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
+        linecolor='black', linewidth=1,
+        range=[0.5, len(filtered_divs) + 0.5]
+    )
+    fig.update_xaxes(title_text="Age", row=1, col=len(filtered_groups)//2 + 1)
     
     fig.update_yaxes(
         title_text=get_metric_label(metric),
@@ -890,8 +919,8 @@ def create_recording_level_violin_plot_by_group(data, metric, title, selected_gr
         zeroline=True, zerolinecolor='rgba(200,200,200,0.5)'
     )
     
-    print(f"   ✅ Created RECORDING-LEVEL plot: {total_recordings} recordings across {len(filtered_groups)} groups")
-    print(f"   📊 Y-axis range: [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created recording-level plot: %d recordings across %d groups", total_recordings, len(filtered_groups))
+    logger.debug("Y-axis range: [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     
     return fig
 
@@ -901,7 +930,7 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
     Create recording-level violin plot by age with MEA-NAP colors and Y-axis controls
     Recording by Age: X-axis shows groups → Colors represent groups (group colors)
     """
-    print(f"🎭 Creating RECORDING-LEVEL violin plot by age for {metric}")
+    logger.debug("Creating recording-level violin plot by age for %s", metric)
     
     # Prepare data using by_group structure
     plot_data, filtered_groups, filtered_divs = prepare_data_for_plotting(
@@ -919,9 +948,17 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
     max_y = 0
     total_recordings = 0
     
+    # Jitter comes from a generator seeded per call, so re-renders place points identically
+    rng = np.random.default_rng(JITTER_SEED)
+    
+    # Every subplot's traces are added to the figure in one call after the loop
+    traces = []
+    trace_cols = []
+    
     # For each DIV (age), create a group comparison subplot
     for col, div in enumerate(filtered_divs, 1):
         div_has_data = False
+        mean_x, mean_y, mean_n = [], [], []
         
         # Within this DIV, show all groups on X-axis
         for group_idx, group in enumerate(filtered_groups):
@@ -935,7 +972,7 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
             div_has_data = True
             
             try:
-                current_max = max(recording_values)
+                current_max = float(np.nanmax(recording_values))
                 max_y = max(max_y, current_max)
                 total_recordings += len(recording_values)
             except (ValueError, TypeError):
@@ -947,9 +984,11 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
             
             x_base = group_idx + 1
             
+            hover_title = f'{group} - DIV {div}'
+            
             # Recording-level visualization (same logic as byGroup but with group colors)
             if len(recording_values) == 1:
-                fig.add_trace(
+                traces.append(
                     go.Scatter(
                         x=[x_base],
                         y=recording_values,
@@ -964,16 +1003,16 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
                         name=f'{group}',
                         legendgroup=f'{group}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>Single Recording<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_SINGLE.format(title=hover_title)
+                    )
                 )
+                trace_cols.append(col)
                 
             elif len(recording_values) <= 3:
-                jitter = np.random.normal(0, 0.12, size=len(recording_values))
-                fig.add_trace(
+                jitter = rng.normal(0, 0.12, size=len(recording_values))
+                traces.append(
                     go.Scatter(
-                        x=[x_base + j for j in jitter],
+                        x=x_base + jitter,
                         y=recording_values,
                         mode='markers',
                         marker=dict(
@@ -986,26 +1025,26 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
                         name=f'{group}',
                         legendgroup=f'{group}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>n={len(recording_values)}<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_MULTI_BY_AGE.format(title=hover_title, n=len(recording_values))
+                    )
                 )
+                trace_cols.append(col)
                 
             else:
-                jitter = np.random.normal(0, 0.06, size=len(recording_values))
-                fig.add_trace(
+                jitter = rng.normal(0, 0.06, size=len(recording_values))
+                traces.append(
                     go.Scatter(
-                        x=[x_base + j for j in jitter],
+                        x=x_base + jitter,
                         y=recording_values,
                         mode='markers',
                         marker=dict(color='black', size=8, opacity=0.8),
                         name=f'{group}',
                         legendgroup=f'{group}',
                         showlegend=(col == 1),
-                        hovertemplate=f'<b>{group} - DIV {div}</b><br>Value: %{{y:.3f}}<br>n={len(recording_values)}<extra></extra>'
-                    ),
-                    row=1, col=col
+                        hovertemplate=RECORDING_HOVER_MULTI_BY_AGE.format(title=hover_title, n=len(recording_values))
+                    )
                 )
+                trace_cols.append(col)
                 
                 # Add violin if enough data
                 if len(recording_values) >= 4:
@@ -1013,12 +1052,11 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
                         kde_data = calculate_half_violin_data(recording_values)
                         x_data = kde_data.get('x')
                         if x_data is not None and len(x_data) > 0:
-                            if isinstance(x_data, np.ndarray):
-                                x_data = x_data.tolist()
+                            x_data = np.asarray(x_data, dtype=np.float32)
                             
-                            fig.add_trace(
+                            traces.append(
                                 go.Violin(
-                                    x=[x_base] * len(x_data),
+                                    x0=x_base,
                                     y=x_data,
                                     width=0.8,
                                     side='both',
@@ -1028,45 +1066,37 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
                                     meanline_visible=False,
                                     showlegend=False,
                                     hoverinfo='skip'
-                                ),
-                                row=1, col=col
+                                )
                             )
+                            trace_cols.append(col)
                     except Exception as e:
-                        print(f"⚠️ Violin plot failed for {group} DIV {div}: {e}")
+                        logger.warning("Violin plot failed for %s DIV %s: %s", group, div, e)
             
-            # Add mean indicator
-            try:
-                mean_value = np.mean(recording_values)
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_base],
-                        y=[mean_value],
-                        mode='markers',
-                        marker=dict(
-                            color='red',
-                            size=10,
-                            opacity=1.0,
-                            line=dict(width=2, color='black'),
-                            symbol='x'
-                        ),
-                        showlegend=False,
-                        hovertemplate=f'<b>Mean: {mean_value:.3f}</b><br>n={len(recording_values)} recordings<extra></extra>'
+            # Mean indicator, drawn with the rest of this subplot's means below
+            mean_x.append(x_base)
+            mean_y.append(float(np.mean(recording_values)))
+            mean_n.append(len(recording_values))
+        
+        # One marker trace holds every mean indicator of the subplot
+        if mean_x:
+            traces.append(
+                go.Scatter(
+                    x=mean_x,
+                    y=mean_y,
+                    customdata=mean_n,
+                    mode='markers',
+                    marker=dict(
+                        color='red',
+                        size=10,
+                        opacity=1.0,
+                        line=dict(width=2, color='black'),
+                        symbol='x'
                     ),
-                    row=1, col=col
+                    showlegend=False,
+                    hovertemplate='<b>Mean: %{y:.3f}</b><br>n=%{customdata} recordings<extra></extra>'
                 )
-            except Exception as e:
-                print(f"⚠️ Mean calculation failed for {group} DIV {div}: {e}")
-        
-        # Update x-axis for this subplot
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_groups) + 1)),
-            ticktext=filtered_groups,
-            title_text="Group" if col == len(filtered_divs)//2 + 1 else "",
-            showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
-            linecolor='black', linewidth=1,
-            range=[0.5, len(filtered_groups) + 0.5],
-            row=1, col=col
-        )
+            )
+            trace_cols.append(col)
         
         # Add "No Data" annotation for empty age subplots
         if not div_has_data:
@@ -1080,6 +1110,19 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
                 row=1, col=col
             )
     
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_groups) + 1)),
+        ticktext=filtered_groups,
+        showgrid=True, gridwidth=1, gridcolor='rgba(200,200,200,0.5)',
+        linecolor='black', linewidth=1,
+        range=[0.5, len(filtered_groups) + 0.5]
+    )
+    fig.update_xaxes(title_text="Group", row=1, col=len(filtered_divs)//2 + 1)
+    
+    if traces:
+        fig.add_traces(traces, rows=[1] * len(traces), cols=trace_cols)
+    
     # Layout
     annotations = []
     annotations.append(
@@ -1116,8 +1159,8 @@ def create_recording_level_violin_plot_by_age(data, metric, title, selected_grou
         zeroline=True, zerolinecolor='rgba(200,200,200,0.5)'
     )
     
-    print(f"   ✅ Created RECORDING-LEVEL by age plot: {total_recordings} recordings across {len(filtered_divs)} age subplots")
-    print(f"   📊 Y-axis range: [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created recording-level by age plot: %d recordings across %d age subplots", total_recordings, len(filtered_divs))
+    logger.debug("Y-axis range: [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     
     return fig
 
@@ -1157,9 +1200,10 @@ def analyze_burst_data_distribution(data, metric='channelBurstRate'):
         
         values = group_data[metric]
         if isinstance(values, (list, np.ndarray)):
-            valid_values = [v for v in values if v is not None and np.isfinite(v) and v > 0]
+            values = np.asarray(values, dtype=float).ravel()
+            valid_values = values[np.isfinite(values) & (values > 0)]
             total_values = len(values)
-            zero_values = len([v for v in values if v == 0])
+            zero_values = np.count_nonzero(values == 0)
             
             print(f"  {group}:")
             print(f"    Total values: {total_values}")
@@ -1168,7 +1212,7 @@ def analyze_burst_data_distribution(data, metric='channelBurstRate'):
             print(f"    NaN values: {total_values - len(valid_values) - zero_values}")
             
             if len(valid_values) > 0:
-                print(f"    Range: {min(valid_values):.2f} - {max(valid_values):.2f}")
+                print(f"    Range: {valid_values.min():.2f} - {valid_values.max():.2f}")
                 print(f"    Mean: {np.mean(valid_values):.2f}")
             else:
                 print(f"    No valid burst data detected")
@@ -1214,7 +1258,7 @@ def create_box_plot_by_group(data, metric, title, selected_groups=None, selected
                     line_color=color,
                     boxpoints='outliers',
                     notched=False,
-                    x=[div_idx] * len(div_values)
+                    x0=div_idx
                 ),
                 row=1, col=col
             )
@@ -1232,13 +1276,12 @@ def create_box_plot_by_group(data, metric, title, selected_groups=None, selected
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
     
-    for col in range(1, len(filtered_groups) + 1):
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_divs) + 1)),
-            ticktext=[str(div) for div in filtered_divs],
-            title_text="Age" if col == len(filtered_groups)//2 + 1 else "",
-            row=1, col=col
-        )
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_divs) + 1)),
+        ticktext=[str(div) for div in filtered_divs]
+    )
+    fig.update_xaxes(title_text="Age", row=1, col=len(filtered_groups)//2 + 1)
     
     fig.update_yaxes(
         title_text=get_metric_label(metric),
@@ -1247,7 +1290,7 @@ def create_box_plot_by_group(data, metric, title, selected_groups=None, selected
         linecolor='black', linewidth=1
     )
     
-    print(f"   ✅ Created Box Plot: Y-range [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created box plot: Y-range [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     return fig
 
 
@@ -1322,7 +1365,7 @@ def create_bar_plot_by_group(data, metric, title, selected_groups=None, selected
         linecolor='black', linewidth=1
     )
     
-    print(f"   ✅ Created Bar Plot: Y-range [{y_min_final:.2f}, {y_max_final:.2f}] ({'manual' if y_range_mode == 'manual' else 'auto'})")
+    logger.debug("Created bar plot: Y-range [%.2f, %.2f] (%s)", y_min_final, y_max_final, y_range_mode)
     return fig
 
 
@@ -1363,18 +1406,17 @@ def create_box_plot_by_age(data, metric, title, selected_groups=None, selected_d
                     marker_color=color,
                     line_color=color,
                     boxpoints='outliers',
-                    x=[group_idx + 1] * len(div_values)
+                    x0=group_idx + 1
                 ),
                 row=1, col=col
             )
-        
-        # Update x-axis for this subplot
-        fig.update_xaxes(
-            tickvals=list(range(1, len(filtered_groups) + 1)),
-            ticktext=filtered_groups,
-            title_text="Group" if col == len(filtered_divs)//2 + 1 else "",
-            row=1, col=col
-        )
+    
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(filtered_groups) + 1)),
+        ticktext=filtered_groups
+    )
+    fig.update_xaxes(title_text="Group", row=1, col=len(filtered_divs)//2 + 1)
     
     # Apply Y-axis controls
     y_min_final, y_max_final = calculate_y_range(plot_data, y_range_mode, y_min, y_max)
@@ -5,7 +5,10 @@ import glob
 import scipy.io as sio
 import h5py
 import mat73
-from data_processing.utilities import extract_div_value, safe_flatten_array, extract_matlab_struct_data
+from data_processing.utilities import (
+    extract_div_value, safe_flatten_array, extract_matlab_struct_data,
+    CARTOGRAPHY_ROLES, encode_cartography_roles, count_cartography_roles
+)
 import re
 
 def load_mat_file(file_path):
@@ -408,7 +411,12 @@ def load_neuronal_activity_data(graph_data_folder, data_info):
                                   'channelFracSpikesInBursts']:
                         if metric in processed_data and processed_data[metric] is not None:
                             # Take MEAN per experiment, not all individual values
-                            exp_mean = np.mean(safe_flatten_array(processed_data[metric]))
+                            metric_values = processed_data[metric]
+                            if isinstance(metric_values, np.ndarray) and metric_values.dtype.kind in 'biuf':
+                                # Numeric arrays are averaged directly, without a round trip through a list
+                                exp_mean = metric_values.mean()
+                            else:
+                                exp_mean = np.mean(safe_flatten_array(metric_values))
                             if not np.isnan(exp_mean):
                                 compiled_data['by_group'][group][metric].append(exp_mean)
                     
@@ -658,7 +666,8 @@ def load_node_cartography_data(graph_data_folder, data_info):
         'by_div': {},         # Data aggregated by DIV
         'groups': data_info['groups'],
         'divs': sorted(set(div for group_divs in data_info['divs'].values() for div in group_divs.keys())),
-        'lags': data_info['lags']
+        'lags': data_info['lags'],
+        'exps_by_group_div': {}  # by_experiment entries indexed by (group, DIV)
     }
     
     # Initialize data structures
@@ -713,6 +722,7 @@ def load_node_cartography_data(graph_data_folder, data_info):
                 'div': div,
                 'lags': {}
             }
+            compiled_data['exps_by_group_div'].setdefault((group, div), []).append(compiled_data['by_experiment'][exp])
             
             # Process each lag value
             for lag in data_info['lags']:
@@ -732,6 +742,17 @@ def load_node_cartography_data(graph_data_folder, data_info):
                         for metric in ['Z', 'PC', 'roles']:  # Note: using Z and PC for cartography
                             processed_cart_data[metric] = extract_matlab_struct_data(cart_struct, metric, [])
                         
+                        # Encode roles once; the counts below and the plots reuse the codes
+                        if 'roles' in processed_cart_data:
+                            roles = safe_flatten_array(processed_cart_data['roles'])
+                            processed_cart_data['role_codes'] = encode_cartography_roles(roles)
+                            role_count_arr = count_cartography_roles(processed_cart_data['role_codes'])
+                            role_counts = dict(zip(CARTOGRAPHY_ROLES, role_count_arr.tolist()))
+                            
+                            # Role fractions for the proportions plot (unrecognised labels count toward the total only)
+                            n_nodes = processed_cart_data['role_codes'].size
+                            processed_cart_data['role_fractions'] = role_count_arr / n_nodes if n_nodes else None
+                        
                         # Store by experiment
                         compiled_data['by_experiment'][exp]['lags'][lag] = processed_cart_data
                         
@@ -748,13 +769,11 @@ def load_node_cartography_data(graph_data_folder, data_info):
                             
                             # Add nodal roles and count them
                             if 'roles' in processed_cart_data:
-                                roles = safe_flatten_array(processed_cart_data['roles'])
-                                
                                 target['nodal_roles'].extend(roles)
                                 
                                 # Count roles
-                                for role in target['role_counts'].keys():
-                                    target['role_counts'][role] += sum(1 for r in roles if str(r) == str(role))
+                                for role, count in role_counts.items():
+                                    target['role_counts'][role] += count
                             
                             target['exp_names'].append(exp)
                             
@@ -141,7 +141,7 @@ def _unwrap_nested_array(nested_array: np.ndarray) -> Optional[str]:
             elif current.size == 1:
                 try:
                     current = current.item()
-                except:
+                except Exception:
                     current = current[0]
             else:
                 current = current[0]
@@ -898,7 +898,7 @@ def calculate_missing_basic_metric(experiment_data, metric):
             return int(np.sum(valid_fr > 0.01))  # Use your active threshold
         else:
             return np.nan
-    except:
+    except Exception:
         return np.nan
     
 def add_recording_metrics_to_experiments(neuronal_data):
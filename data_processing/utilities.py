@@ -1,11 +1,60 @@
 # data_processing/utilities.py - CLEANED VERSION - Removed debug/verification functions
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
-from scipy import stats
 import re
 
+# LRU cache of calculate_half_violin_data results, keyed by a digest of the cleaned input
+HALF_VIOLIN_CACHE_SIZE = 512
+_half_violin_cache = OrderedDict()
+_half_violin_cache_lock = threading.Lock()
+
+# Number of data points evaluated against the grid per block in _gaussian_kde_on_grid
+KDE_CHUNK_SIZE = 4096
+
+# Above this many points the KDE is evaluated from a linearly binned copy of the data
+KDE_BINNING_THRESHOLD = 2048
+KDE_BIN_COUNT = 1024
+
+def _gaussian_kde_on_grid(data_values, grid, kernel_width):
+    """
+    Evaluate a 1-D Gaussian KDE on a fixed grid with plain numpy broadcasting.
+    
+    Matches scipy.stats.gaussian_kde with a scalar bw_method, where the kernel
+    width is the bandwidth factor times the sample standard deviation. Large
+    inputs are first spread linearly over KDE_BIN_COUNT points spanning the
+    grid, which keeps the cost independent of the number of data points.
+    """
+    n_values = len(data_values)
+    weights = None
+    if n_values > KDE_BINNING_THRESHOLD:
+        bin_width = (grid[-1] - grid[0]) / (KDE_BIN_COUNT - 1)
+        position = np.clip((data_values - grid[0]) / bin_width, 0, KDE_BIN_COUNT - 1)
+        lower = np.minimum(position.astype(np.intp), KDE_BIN_COUNT - 2)
+        upper_share = position - lower
+        weights = (np.bincount(lower, 1 - upper_share, KDE_BIN_COUNT)
+                   + np.bincount(lower + 1, upper_share, KDE_BIN_COUNT))
+        data_values = grid[0] + bin_width * np.arange(KDE_BIN_COUNT)
+    
+    inv_width = 1.0 / kernel_width
+    density = np.zeros(len(grid))
+    for start in range(0, len(data_values), KDE_CHUNK_SIZE):
+        block = data_values[start:start + KDE_CHUNK_SIZE]
+        z = (grid[:, None] - block[None, :]) * inv_width
+        kernel = np.exp(-0.5 * z * z)
+        if weights is None:
+            density += kernel.sum(axis=1)
+        else:
+            density += kernel @ weights[start:start + KDE_CHUNK_SIZE]
+    return density * (inv_width / (n_values * np.sqrt(2 * np.pi)))
+
 def calculate_half_violin_data(data_values, bandwidth=None):
     """
     Calculate kernel density estimation for half violin plots with robust error handling
+    
+    A NaN-free float ndarray is used without copying, so 'raw_data' may share
+    memory with data_values.
     """
     # Remove NaN values
     # data_values = np.array(data_values)
@@ -22,9 +71,50 @@ def calculate_half_violin_data(data_values, bandwidth=None):
     #         'sem': stats.sem(data_values) if len(data_values) > 0 else np.nan
     #     }
 
-    data_values = np.array(data_values)
-    data_values = data_values[~np.isnan(data_values)]
+    data_values = np.asarray(data_values, dtype=float)
+    nan_mask = np.isnan(data_values)
+    if nan_mask.any():
+        data_values = data_values[~nan_mask]
+    
+    # Identical input (e.g. re-rendering the same view) reuses the earlier result
+    cache_key = (
+        data_values.size,
+        data_values.dtype.str,
+        bandwidth,
+        hashlib.blake2b(np.ascontiguousarray(data_values).view(np.uint8), digest_size=8).digest()
+    )
+    with _half_violin_cache_lock:
+        cached = _half_violin_cache.get(cache_key)
+        if cached is not None:
+            _half_violin_cache.move_to_end(cache_key)
+    if cached is not None:
+        return _copy_half_violin_result(cached, data_values)
+    
+    result = _compute_half_violin_data(data_values, bandwidth)
     
+    # Only the derived grid and statistics are kept, never the input array
+    cached = _copy_half_violin_result(result, None)
+    del cached['raw_data']
+    with _half_violin_cache_lock:
+        _half_violin_cache[cache_key] = cached
+        if len(_half_violin_cache) > HALF_VIOLIN_CACHE_SIZE:
+            _half_violin_cache.popitem(last=False)
+    return result
+
+def _copy_half_violin_result(result, raw_data):
+    """Copy of a half violin result with its own x/y sequences and raw_data set to raw_data"""
+    result_copy = {key: value.copy() if isinstance(value, (np.ndarray, list)) else value
+                   for key, value in result.items()}
+    result_copy['raw_data'] = raw_data
+    return result_copy
+
+def clear_half_violin_cache():
+    """Drop all cached half violin results (call when new data is loaded)"""
+    with _half_violin_cache_lock:
+        _half_violin_cache.clear()
+
+def _compute_half_violin_data(data_values, bandwidth):
+    """KDE and summary statistics for NaN-free data_values"""
     if len(data_values) <= 1:
         return {'x': [], 'y': [], 'raw_data': data_values, 'mean': np.mean(data_values) if len(data_values) > 0 else np.nan}
     
@@ -39,9 +129,16 @@ def calculate_half_violin_data(data_values, bandwidth=None):
             'mean': unique_val
     }
     
+    # Moments and extremes computed once and shared by every branch below
+    n_values = len(data_values)
+    mean_val = np.mean(data_values)
+    sum_sq_dev = np.dot(data_values - mean_val, data_values - mean_val)
+    data_min, data_max = np.min(data_values), np.max(data_values)
+    
     # CHECK FOR LOW VARIANCE DATA (main fix for the KDE error)
-    data_std = np.std(data_values)
-    data_range = np.max(data_values) - np.min(data_values)
+    data_std = np.sqrt(sum_sq_dev / n_values)
+    sample_std = np.sqrt(sum_sq_dev / (n_values - 1))
+    data_range = data_max - data_min
     
     # If all values are identical or nearly identical
     if data_std < 1e-10 or data_range < 1e-10:
@@ -49,7 +146,6 @@ def calculate_half_violin_data(data_values, bandwidth=None):
         print(f"Values: {data_values[:10]}...")  # Show first 10 values
         
         # Return a simple point distribution instead of KDE
-        mean_val = np.mean(data_values)
         return {
             'x': [mean_val - 0.1, mean_val, mean_val + 0.1],  # Small spread around mean
             'y': [0, len(data_values), 0],  # Simple triangle distribution
@@ -57,7 +153,7 @@ def calculate_half_violin_data(data_values, bandwidth=None):
             'mean': mean_val,
             'median': np.median(data_values),
             'std': data_std,
-            'sem': stats.sem(data_values)
+            'sem': sample_std / np.sqrt(n_values)
         }
     
     # NORMAL KDE CALCULATION for data with variance
@@ -65,44 +161,64 @@ def calculate_half_violin_data(data_values, bandwidth=None):
         # Calculate KDE
         if bandwidth is None:
             # Use Scott's rule for bandwidth selection
-            bandwidth = 1.06 * np.std(data_values) * len(data_values) ** (-1/5)
+            bandwidth = 1.06 * data_std * n_values ** (-1/5)
         
-        kde = stats.gaussian_kde(data_values, bw_method=bandwidth)
-        x_min, x_max = np.min(data_values), np.max(data_values)
         # Extend range by 5% on each side
-        x_range = x_max - x_min
-        x_min -= 0.05 * x_range
-        x_max += 0.05 * x_range
+        x_min = data_min - 0.05 * data_range
+        x_max = data_max + 0.05 * data_range
         
         x = np.linspace(x_min, x_max, 100)
-        y = kde(x)
+        y = _gaussian_kde_on_grid(data_values, x, bandwidth * sample_std)
         
         return {
             'x': x,
             'y': y,
             'raw_data': data_values,
-            'mean': np.mean(data_values),
+            'mean': mean_val,
             'median': np.median(data_values),
-            'std': np.std(data_values),
-            'sem': stats.sem(data_values)
+            'std': data_std,
+            'sem': sample_std / np.sqrt(n_values)
         }
         
     except Exception as e:
         print(f"⚠️ KDE calculation failed: {e}")
         # Fallback to simple distribution
-        mean_val = np.mean(data_values)
-        std_val = np.std(data_values)
-        
         return {
-            'x': [mean_val - std_val, mean_val, mean_val + std_val],
+            'x': [mean_val - data_std, mean_val, mean_val + data_std],
             'y': [0, len(data_values), 0],
             'raw_data': data_values,
             'mean': mean_val,
             'median': np.median(data_values),
-            'std': std_val,
-            'sem': stats.sem(data_values)
+            'std': data_std,
+            'sem': sample_std / np.sqrt(n_values)
         }
 
+# Node cartography roles in their canonical order
+CARTOGRAPHY_ROLES = (
+    'Peripheral',
+    'Non-hub connector',
+    'Non-hub kinless',
+    'Provincial hub',
+    'Connector hub',
+    'Kinless hub'
+)
+_SORTED_CARTOGRAPHY_ROLES = np.array(sorted(CARTOGRAPHY_ROLES))
+_SORTED_ROLE_CODES = np.array([CARTOGRAPHY_ROLES.index(role) for role in _SORTED_CARTOGRAPHY_ROLES], dtype=np.int8)
+
+def encode_cartography_roles(roles):
+    """
+    Encode node role labels as int8 indices into CARTOGRAPHY_ROLES
+    
+    Labels that are not a known role are encoded as -1.
+    """
+    roles = np.asarray(roles).ravel().astype(str)
+    sorted_pos = np.minimum(np.searchsorted(_SORTED_CARTOGRAPHY_ROLES, roles), len(_SORTED_CARTOGRAPHY_ROLES) - 1)
+    return np.where(_SORTED_CARTOGRAPHY_ROLES[sorted_pos] == roles, _SORTED_ROLE_CODES[sorted_pos], -1).astype(np.int8)
+
+def count_cartography_roles(role_codes):
+    """Number of nodes in each CARTOGRAPHY_ROLES role, from encode_cartography_roles output"""
+    return np.bincount(role_codes[role_codes >= 0], minlength=len(CARTOGRAPHY_ROLES))
+
 def extract_div_value(div_string):
     """
     Extract a DIV value from a string, handling complex formats
@@ -131,6 +247,56 @@ def extract_div_value(div_string):
     # If no simple numeric extraction works, return the original string without DIV
     return div_str
 
+def extract_experiment_div(exp_name):
+    """
+    Extract the DIV of an experiment name the way the data loader does
+    
+    The first '_'-separated part containing 'DIV' is parsed with extract_div_value,
+    so 'WT_exp1_DIV28' gives 28 and 'WT_DIV20240816-24w-50' gives 50.
+    
+    Parameters:
+    -----------
+    exp_name : str
+        Experiment name
+        
+    Returns:
+    --------
+    Union[int, str, None]
+        Extracted DIV value, or None if the name has no DIV part
+    """
+    for part in exp_name.split('_'):
+        if 'DIV' in part:
+            return extract_div_value(part)
+    return None
+
+def index_experiments_by_div(exp_names, by_experiment=None):
+    """
+    Map each DIV named in exp_names to the positions of its experiments
+    
+    Parameters:
+    -----------
+    exp_names : list
+        Experiment names, in the same order as the metric values
+    by_experiment : dict, optional
+        Loaded experiments by name; an experiment's stored 'div' is used when
+        present, and only otherwise is its DIV parsed from the name
+        
+    Returns:
+    --------
+    dict
+        DIV value -> list of positions into exp_names; experiments without a
+        DIV are left out
+    """
+    by_experiment = by_experiment or {}
+    div_positions = {}
+    for i, exp_name in enumerate(exp_names):
+        div = by_experiment.get(exp_name, {}).get('div')
+        if div is None:
+            div = extract_experiment_div(exp_name)
+        if div is not None:
+            div_positions.setdefault(div, []).append(i)
+    return div_positions
+
 def safe_flatten_array(array_data):
     """
     Safely flatten array data from MATLAB structures
@@ -160,7 +326,7 @@ def safe_flatten_array(array_data):
                     for field in item.dtype.names:
                         if item[field] is not None:
                             result.append(item[field])
-                except:
+                except Exception:
                     pass
             return result
         
@@ -219,7 +385,7 @@ def extract_matlab_struct_data(struct_data, field_name, default=None):
                     return getattr(struct_data, field_name)
                 elif hasattr(struct_data, field_name):
                     return getattr(struct_data, field_name)
-            except:
+            except Exception:
                 pass
                 
         # Check if it's a numpy structured array element
@@ -400,6 +400,11 @@ METRIC_TITLES_ENHANCED = {
     'FRmedian': 'Median Firing Rate'
 }
 
+def hex_to_rgba(hex_color, alpha):
+    """Convert a '#RRGGBB' color to an rgba() string with the given alpha"""
+    r, g, b = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgba({r}, {g}, {b}, {alpha})'
+
 def generate_viridis_colors(n_divs):
     """Generate viridis colormap for age-based coloring (flipped like MEA-NAP)"""
     viridis_base = [
@@ -514,7 +519,7 @@ def get_mea_nap_colors(neuronal_data, plot_type):
         
         line_colors[div] = base_color
         # Create fill color with transparency
-        fill_colors[div] = base_color.replace('#', 'rgba(') + ', 0.6)'
+        fill_colors[div] = hex_to_rgba(base_color, 0.6)
     
     # Return the expected dictionary structure
     return {
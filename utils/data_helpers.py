@@ -16,8 +16,8 @@ Function Categories:
 
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
-from scipy import stats
 import warnings
+from data_processing.utilities import index_experiments_by_div
 warnings.filterwarnings('ignore')
 
 # =============================================================================
@@ -107,12 +107,9 @@ def clean_numeric_array(values: Union[List, np.ndarray]) -> np.ndarray:
     Returns:
         np.ndarray: Cleaned array
     """
-    if not isinstance(values, np.ndarray):
-        values = np.array(values)
-    
-    # Remove NaN, infinite, and None values
-    mask = np.isfinite(values) & (values != None)
-    return values[mask]
+    # None converts to NaN, so one finite mask removes NaN, infinite, and None values
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return values[np.isfinite(values)]
 
 def filter_by_threshold(values: Union[List, np.ndarray], threshold: float, 
                        operation: str = 'greater') -> np.ndarray:
@@ -159,13 +156,13 @@ def remove_outliers(values: Union[List, np.ndarray], method: str = 'iqr',
         return values, np.array([])
     
     if method == 'iqr':
-        q25 = np.percentile(values, 25)
-        q75 = np.percentile(values, 75)
+        q25, q75 = np.percentile(values, [25, 75])
         iqr = q75 - q25
         lower_bound = q25 - factor * iqr
         upper_bound = q75 + factor * iqr
         outlier_mask = (values < lower_bound) | (values > upper_bound)
     elif method == 'zscore':
+        from scipy import stats  # deferred: scipy.stats is slow to import and rarely needed
         z_scores = np.abs(stats.zscore(values))
         outlier_mask = z_scores > factor
     else:
@@ -202,14 +199,16 @@ def filter_data_by_div(data: Dict, metric: str, target_div: int) -> Dict:
         if metric not in group_data or 'exp_names' not in group_data:
             continue
         
+        metric_values = group_data[metric]
         filtered_values = []
         filtered_exp_names = []
         
-        for i, exp_name in enumerate(group_data['exp_names']):
-            if f'DIV{target_div}' in exp_name:
-                if i < len(group_data[metric]):
-                    filtered_values.append(group_data[metric][i])
-                    filtered_exp_names.append(exp_name)
+        # Experiments of target_div, by their loaded DIVs (or names) as elsewhere
+        div_positions = index_experiments_by_div(group_data['exp_names'], data.get('by_experiment'))
+        for i in div_positions.get(target_div, []):
+            if i < len(metric_values):
+                filtered_values.append(metric_values[i])
+                filtered_exp_names.append(group_data['exp_names'][i])
         
         filtered_data['by_group'][group] = {
             metric: filtered_values,
@@ -360,16 +359,20 @@ def calculate_basic_stats(values: Union[List, np.ndarray]) -> Dict[str, float]:
             'q75': np.nan
         }
     
+    # One percentile call for all three quartiles, and the SEM reuses the sample std
+    q25, median, q75 = np.percentile(values, [25, 50, 75])
+    std = np.std(values, ddof=1) if len(values) > 1 else 0
+    
     return {
         'count': len(values),
         'mean': np.mean(values),
-        'median': np.median(values),
-        'std': np.std(values, ddof=1) if len(values) > 1 else 0,
-        'sem': stats.sem(values) if len(values) > 1 else 0,
-        'min': np.min(values),
-        'max': np.max(values),
-        'q25': np.percentile(values, 25),
-        'q75': np.percentile(values, 75)
+        'median': median,
+        'std': std,
+        'sem': std / np.sqrt(len(values)) if len(values) > 1 else 0,
+        'min': values.min(),
+        'max': values.max(),
+        'q25': q25,
+        'q75': q75
     }
 
 def calculate_active_electrodes(fr_values: Union[List, np.ndarray], 
@@ -425,6 +428,8 @@ def calculate_confidence_interval(values: Union[List, np.ndarray],
     if len(values) < 2:
         return np.nan, np.nan
     
+    from scipy import stats  # deferred: scipy.stats is slow to import and rarely needed
+    
     mean = np.mean(values)
     sem = stats.sem(values)
     
@@ -454,8 +459,10 @@ def format_data_for_plotting(data: Dict, metric: str, groups: List[str],
         Dict: Formatted data ready for plotting
     """
     # Filter groups and DIVs
-    filtered_groups = [g for g in groups if g in data['groups']] if groups else data['groups']
-    filtered_divs = [d for d in selected_divs if d in data['divs']] if selected_divs else sorted(data['divs'])
+    available_groups = set(data['groups'])
+    available_divs = set(data['divs'])
+    filtered_groups = [g for g in groups if g in available_groups] if groups else data['groups']
+    filtered_divs = [d for d in selected_divs if d in available_divs] if selected_divs else sorted(data['divs'])
     
     plot_data = {}
     
@@ -469,6 +476,9 @@ def format_data_for_plotting(data: Dict, metric: str, groups: List[str],
         
         plot_data[group] = {}
         
+        # Positions of each DIV's experiments, from their loaded DIVs (or names)
+        div_positions = index_experiments_by_div(group_data.get('exp_names', []), data.get('by_experiment'))
+        
         # For each DIV, extract the relevant data
         for div in filtered_divs:
             div_values = []
@@ -476,14 +486,17 @@ def format_data_for_plotting(data: Dict, metric: str, groups: List[str],
             # Check if this is recording-level data (has exp_names)
             if 'exp_names' in group_data and group_data['exp_names']:
                 # Extract values for this specific DIV
-                for i, exp_name in enumerate(group_data['exp_names']):
-                    if f'DIV{div}' in exp_name:
-                        if i < len(group_data[metric]):
-                            value = group_data[metric][i]
-                            if isinstance(value, (list, np.ndarray)):
-                                div_values.extend(value)
-                            else:
-                                div_values.append(value)
+                metric_values = group_data[metric]
+                if isinstance(metric_values, np.ndarray) and metric_values.dtype != object:
+                    # Numeric arrays gather every experiment of this DIV in one indexing step
+                    positions = np.asarray(div_positions.get(div, ()), dtype=np.intp)
+                    div_values = metric_values[positions[positions < len(metric_values)]]
+                else:
+                    # Flatten each experiment into a chunk and join them with one concatenate
+                    chunks = [np.asarray(metric_values[i], dtype=float).ravel()
+                              for i in div_positions.get(div, ()) if i < len(metric_values)]
+                    if chunks:
+                        div_values = np.concatenate(chunks)
                 
                 # If no DIV-specific data found, use all data (fallback)
                 if len(div_values) == 0:
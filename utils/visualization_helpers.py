@@ -23,7 +23,10 @@ from utils.config import (
     get_matlab_color, get_matlab_fill_color, get_metric_label
 )
 from utils.data_helpers import clean_numeric_array, calculate_basic_stats
-from data_processing.utilities import calculate_half_violin_data
+from data_processing.utilities import calculate_half_violin_data, index_experiments_by_div
+
+# Seed of the per-call jitter generators, so the same data always renders the same
+JITTER_SEED = 0
 
 # =============================================================================
 # PLOT STYLING AND CONFIGURATION
@@ -114,19 +117,17 @@ def update_subplot_axes(fig: go.Figure, divs: List[int], num_groups: int,
     Returns:
         go.Figure: Figure with updated axes
     """
-    # Update x-axes for each subplot
-    for col in range(1, num_groups + 1):
-        fig.update_xaxes(
-            tickvals=list(range(1, len(divs) + 1)),
-            ticktext=[str(div) for div in divs],
-            title_text="Age" if col == num_groups // 2 + 1 else "",
-            showgrid=True,
-            gridwidth=PLOT_CONFIG['line_width'],
-            gridcolor=PLOT_CONFIG['grid_color'],
-            linecolor=PLOT_CONFIG['line_color'],
-            linewidth=PLOT_CONFIG['line_width'],
-            row=1, col=col
-        )
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=list(range(1, len(divs) + 1)),
+        ticktext=[str(div) for div in divs],
+        showgrid=True,
+        gridwidth=PLOT_CONFIG['line_width'],
+        gridcolor=PLOT_CONFIG['grid_color'],
+        linecolor=PLOT_CONFIG['line_color'],
+        linewidth=PLOT_CONFIG['line_width']
+    )
+    fig.update_xaxes(title_text="Age", row=1, col=num_groups // 2 + 1)
     
     # Update y-axis
     fig.update_yaxes(
@@ -158,20 +159,18 @@ def update_age_based_axes(fig: go.Figure, divs: List[int], num_groups: int,
     Returns:
         go.Figure: Figure with updated axes
     """
-    # Update x-axes for age-based plots
-    for col in range(1, num_groups + 1):
-        fig.update_xaxes(
-            tickvals=divs,
-            ticktext=[str(div) for div in divs],
-            title_text="Age" if col == num_groups // 2 + 1 else "",
-            range=[min(divs) - 2, max(divs) + 2] if divs else [0, 100],
-            showgrid=True,
-            gridwidth=PLOT_CONFIG['line_width'],
-            gridcolor=PLOT_CONFIG['grid_color'],
-            linecolor=PLOT_CONFIG['line_color'],
-            linewidth=PLOT_CONFIG['line_width'],
-            row=1, col=col
-        )
+    # Update x-axes (one call styles every subplot; the middle one carries the title)
+    fig.update_xaxes(
+        tickvals=divs,
+        ticktext=[str(div) for div in divs],
+        range=[min(divs) - 2, max(divs) + 2] if divs else [0, 100],
+        showgrid=True,
+        gridwidth=PLOT_CONFIG['line_width'],
+        gridcolor=PLOT_CONFIG['grid_color'],
+        linecolor=PLOT_CONFIG['line_color'],
+        linewidth=PLOT_CONFIG['line_width']
+    )
+    fig.update_xaxes(title_text="Age", row=1, col=num_groups // 2 + 1)
     
     # Update y-axis
     fig.update_yaxes(
@@ -262,6 +261,9 @@ def organize_plot_data(data: Dict, metric: str, groups: List[str],
         
         plot_data[group] = {}
         
+        # Positions of each DIV's experiments, from their loaded DIVs (or names)
+        div_positions = index_experiments_by_div(group_data.get('exp_names', []), data.get('by_experiment'))
+        
         # For each DIV, extract the relevant data
         for div in divs:
             div_values = []
@@ -269,14 +271,17 @@ def organize_plot_data(data: Dict, metric: str, groups: List[str],
             # Check if this is recording-level data (has exp_names)
             if 'exp_names' in group_data and group_data['exp_names']:
                 # Extract values for this specific DIV
-                for i, exp_name in enumerate(group_data['exp_names']):
-                    if f'DIV{div}' in exp_name:
-                        if i < len(group_data[metric]):
-                            value = group_data[metric][i]
-                            if isinstance(value, (list, np.ndarray)):
-                                div_values.extend(value)
-                            else:
-                                div_values.append(value)
+                metric_values = group_data[metric]
+                if isinstance(metric_values, np.ndarray) and metric_values.dtype != object:
+                    # Numeric arrays gather every experiment of this DIV in one indexing step
+                    positions = np.asarray(div_positions.get(div, ()), dtype=np.intp)
+                    div_values = metric_values[positions[positions < len(metric_values)]]
+                else:
+                    # Flatten each experiment into a chunk and join them with one concatenate
+                    chunks = [np.asarray(metric_values[i], dtype=float).ravel()
+                              for i in div_positions.get(div, ()) if i < len(metric_values)]
+                    if chunks:
+                        div_values = np.concatenate(chunks)
                 
                 # If no DIV-specific data found, use all data (fallback)
                 if len(div_values) == 0:
@@ -314,11 +319,11 @@ def add_individual_points(fig: go.Figure, x_base: float, values: List[float],
         return fig
     
     # Add jitter for better visualization
-    jitter = np.random.normal(0, 0.02, size=len(values))
+    jitter = np.random.default_rng(JITTER_SEED).normal(0, 0.02, size=len(values))
     
     fig.add_trace(
         go.Scatter(
-            x=[x_base + j for j in jitter],
+            x=x_base + jitter,
             y=values,
             mode='markers',
             marker=dict(
@@ -356,8 +361,8 @@ def add_violin_shape(fig: go.Figure, x_base: float, kde_data: Dict,
     
     fig.add_trace(
         go.Violin(
-            x=[x_base] * len(kde_data['x']),
-            y=kde_data['x'],
+            x0=x_base,
+            y=np.asarray(kde_data['x'], dtype=np.float32),
             width=0.6,
             side='both',
             line_color=color,